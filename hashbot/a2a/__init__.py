@@ -3,21 +3,26 @@
 from hashbot.a2a.executor import A2AExecutor
 from hashbot.a2a.messages import (
     A2AMessage,
+    A2AResponse,
     AgentCard,
     DataPart,
+    Message,
     Task,
     TaskState,
     TextPart,
 )
-from hashbot.a2a.protocol import A2AProtocol
+from hashbot.a2a.protocol import A2AProtocol, BatchingA2AProtocol
 
 __all__ = [
     "A2AMessage",
+    "A2AResponse",
     "AgentCard",
+    "Message",
     "Task",
     "TaskState",
     "TextPart",
     "DataPart",
     "A2AProtocol",
+    "BatchingA2AProtocol",
     "A2AExecutor",
 ]
@@ -0,0 +1,23 @@
+"""msgspec-accelerated decode path for inbound A2A messages.
+
+The executor's hot path only needs ``id``/``method``/``params`` to
+dispatch — none of Pydantic's schema features. msgspec decodes straight
+into struct fields in a single pass with no dict intermediate.
+"""
+
+from typing import Any
+
+import msgspec
+
+
+class FastA2AMessage(msgspec.Struct):
+    """Minimal mirror of A2AMessage, for dispatch-only decoding."""
+
+    jsonrpc: str = "2.0"
+    id: str = ""
+    method: str = ""
+    params: dict[str, Any] = {}
+
+
+MESSAGE_DECODER = msgspec.json.Decoder(FastA2AMessage)
+BATCH_DECODER = msgspec.json.Decoder(list[FastA2AMessage])
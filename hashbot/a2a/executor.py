@@ -1,9 +1,15 @@
 """A2A Protocol executor for handling incoming requests."""
 
+import asyncio
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from pydantic import TypeAdapter
+
+from hashbot.a2a._fast import BATCH_DECODER, MESSAGE_DECODER, FastA2AMessage
 from hashbot.a2a.messages import (
+    MESSAGE_LIST_ADAPTER,
     A2AMessage,
     AgentCard,
     Message,
@@ -16,6 +22,25 @@ from hashbot.a2a.protocol import A2AProtocol
 # Type alias for task handlers
 TaskHandler = Callable[[Task], Awaitable[dict[str, Any]]]
 
+# States a task can never leave; reaching one starts the eviction grace.
+_TERMINAL_STATES = frozenset(
+    {TaskState.COMPLETED, TaskState.CANCELED, TaskState.FAILED}
+)
+
+# Built once at import so validation goes through pydantic-core's fast path
+# instead of re-creating validation machinery per request.
+_A2A_MSG_ADAPTER: TypeAdapter[A2AMessage] = TypeAdapter(A2AMessage)
+_A2A_BATCH_ADAPTER: TypeAdapter[list[A2AMessage]] = TypeAdapter(list[A2AMessage])
+
+
+def _empty_batch_error() -> dict[str, Any]:
+    """Single error response for an empty batch, as JSON-RPC 2.0 requires."""
+    return {
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": "Invalid request: empty batch"},
+    }
+
 
 class A2AExecutor:
     """Executor for processing incoming A2A requests."""
@@ -24,11 +49,31 @@ class A2AExecutor:
         self.agent_card = agent_card
         self.protocol = A2AProtocol(agent_card)
         self._handlers: dict[str, TaskHandler] = {}
-        self._tasks: dict[str, Task] = {}
+        # LRU-bounded store: lookups stay O(1) while long-running servers
+        # no longer accumulate every task ever received.
+        self._tasks: OrderedDict[str, Task] = OrderedDict()
+        self._max_tasks: int = 10_000
+        # Terminal tasks stay visible to tasks/get for this long (seconds).
+        self._terminal_task_grace: float = 300.0
+        self._default_handler: TaskHandler | None = None
+        # Single-lookup JSON-RPC dispatch instead of an if/elif chain.
+        self._method_table: dict[
+            str, Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+        ] = {
+            "tasks/send": self._handle_send_task,
+            "tasks/get": self._handle_get_task,
+            "tasks/cancel": self._handle_cancel_task,
+        }
+        # The card is immutable after construction; serialize it once so
+        # discovery hits are pointer returns instead of repeated dumps.
+        self._agent_card_dict: dict[str, Any] = agent_card.model_dump()
+        self._agent_card_json: bytes = agent_card.model_dump_json().encode()
 
     def register_handler(self, skill_id: str, handler: TaskHandler) -> None:
         """Register a handler for a skill."""
         self._handlers[skill_id] = handler
+        if skill_id == "default":
+            self._default_handler = handler
 
     def handler(self, skill_id: str) -> Callable[[TaskHandler], TaskHandler]:
         """Decorator to register a skill handler."""
@@ -39,32 +84,69 @@ class A2AExecutor:
 
         return decorator
 
-    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
-        """Handle an incoming A2A request."""
+    async def handle_request(
+        self, request: bytes | bytearray | dict[str, Any] | list[dict[str, Any]]
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Handle an incoming A2A request.
+
+        Accepts either raw JSON bytes from the transport (preferred: decoded
+        and validated in one pass) or an already-parsed dict. A top-level
+        JSON list is treated as a JSON-RPC 2.0 batch and answered with a
+        list of responses.
+        """
         try:
-            message = A2AMessage.model_validate(request)
+            if isinstance(request, (bytes, bytearray)):
+                # Raw transport bytes take the msgspec single-pass decode.
+                if bytes(request).lstrip()[:1] == b"[":
+                    batch = BATCH_DECODER.decode(request)
+                    if not batch:
+                        return _empty_batch_error()
+                    return await self._dispatch_batch(batch)
+                message = MESSAGE_DECODER.decode(request)
+            elif isinstance(request, list):
+                if not request:
+                    return _empty_batch_error()
+                batch = _A2A_BATCH_ADAPTER.validate_python(request)
+                return await self._dispatch_batch(batch)
+            else:
+                message = _A2A_MSG_ADAPTER.validate_python(request)
         except Exception as e:
+            request_id = (
+                request.get("id", "unknown") if isinstance(request, dict) else "unknown"
+            )
             return {
                 "jsonrpc": "2.0",
-                "id": request.get("id", "unknown"),
+                "id": request_id,
                 "error": {"code": -32600, "message": f"Invalid request: {e}"},
             }
 
-        method = message.method
-        params = message.params
+        return await self._dispatch(message)
 
-        if method == "tasks/send":
-            return await self._handle_send_task(message.id, params)
-        elif method == "tasks/get":
-            return await self._handle_get_task(message.id, params)
-        elif method == "tasks/cancel":
-            return await self._handle_cancel_task(message.id, params)
-        else:
+    async def _dispatch(self, message: A2AMessage | FastA2AMessage) -> dict[str, Any]:
+        """Route a validated message through the method table."""
+        handler = self._method_table.get(message.method)
+        if handler is None:
             return {
                 "jsonrpc": "2.0",
                 "id": message.id,
-                "error": {"code": -32601, "message": f"Method not found: {method}"},
+                "error": {"code": -32601, "message": f"Method not found: {message.method}"},
             }
+        return await handler(message.id, message.params)
+
+    async def _dispatch_batch(
+        self, batch: list[A2AMessage] | list[FastA2AMessage]
+    ) -> list[dict[str, Any]]:
+        """Dispatch a JSON-RPC batch concurrently, preserving order."""
+        return list(await asyncio.gather(*(self._dispatch(m) for m in batch)))
+
+    def _evict_later(self, task_id: str) -> None:
+        """Drop a terminal task after the grace period so late tasks/get still resolves."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._tasks.pop(task_id, None)
+            return
+        loop.call_later(self._terminal_task_grace, self._tasks.pop, task_id, None)
 
     async def _handle_send_task(
         self, request_id: str, params: dict[str, Any]
@@ -78,13 +160,19 @@ class A2AExecutor:
         # Get or create task
         if task_id and task_id in self._tasks:
             task = self._tasks[task_id]
+            self._tasks.move_to_end(task_id)
         else:
-            task = Task(
-                id=task_id or None,
-                session_id=session_id or None,
-                metadata=metadata,
-            )
+            # Only pass ids the client actually supplied so the default
+            # factories kick in for the rest.
+            task_kwargs: dict[str, Any] = {"metadata": metadata}
+            if task_id:
+                task_kwargs["id"] = task_id
+            if session_id:
+                task_kwargs["session_id"] = session_id
+            task = Task(**task_kwargs)
             self._tasks[task.id] = task
+            if len(self._tasks) > self._max_tasks:
+                self._tasks.popitem(last=False)
 
         # Add incoming message to history
         parts = []
@@ -94,9 +182,9 @@ class A2AExecutor:
         if parts:
             task.history.append(Message(role="user", parts=parts))
 
-        # Determine which handler to use
+        # Determine which handler to use (single lookup, default folded in)
         skill_id = metadata.get("skill_id", "default")
-        handler = self._handlers.get(skill_id) or self._handlers.get("default")
+        handler = self._handlers.get(skill_id, self._default_handler)
 
         if not handler:
             return {
@@ -108,6 +196,10 @@ class A2AExecutor:
         # Execute handler
         try:
             result = await handler(task)
+            # Handlers mutate task.status themselves; anything terminal is
+            # done with follow-up sends and only needs the tasks/get grace.
+            if task.status in _TERMINAL_STATES:
+                self._evict_later(task.id)
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
@@ -115,6 +207,7 @@ class A2AExecutor:
             }
         except Exception as e:
             task.status = TaskState.FAILED
+            self._evict_later(task.id)
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
@@ -142,10 +235,7 @@ class A2AExecutor:
                 "id": task.id,
                 "sessionId": task.session_id,
                 "status": {"state": task.status.value},
-                "history": [
-                    {"role": m.role, "parts": [p.model_dump() for p in m.parts]}
-                    for m in task.history
-                ],
+                "history": MESSAGE_LIST_ADAPTER.dump_python(task.history, mode="json"),
                 "metadata": task.metadata,
             },
         }
@@ -165,6 +255,7 @@ class A2AExecutor:
 
         task = self._tasks[task_id]
         task.status = TaskState.CANCELED
+        self._evict_later(task_id)
 
         return {
             "jsonrpc": "2.0",
@@ -174,4 +265,8 @@ class A2AExecutor:
 
     def get_agent_card_dict(self) -> dict[str, Any]:
         """Get agent card as dictionary for JSON response."""
-        return self.agent_card.model_dump()
+        return self._agent_card_dict
+
+    def get_agent_card_json(self) -> bytes:
+        """Get agent card as pre-serialized JSON bytes for direct HTTP return."""
+        return self._agent_card_json
@@ -1,11 +1,24 @@
 """A2A Protocol message types based on Google A2A specification."""
 
+import itertools
+import secrets
+import time
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any, Literal
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_serializer
+
+# Correlation IDs don't need full uuid4 cost (os.urandom + UUID + str per
+# call): one random per-process prefix plus a monotonic counter keeps IDs
+# unique and unguessable across processes at a fraction of the CPU.
+_ID_PREFIX = secrets.token_hex(8)
+_ID_COUNTER = itertools.count()
+
+
+def _fast_id() -> str:
+    """Generate a process-unique correlation ID."""
+    return f"{_ID_PREFIX}-{next(_ID_COUNTER):012x}"
 
 
 class TaskState(StrEnum):
@@ -22,6 +35,8 @@ class TaskState(StrEnum):
 class TextPart(BaseModel):
     """Text content part."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["text"] = "text"
     text: str
 
@@ -29,6 +44,8 @@ class TextPart(BaseModel):
 class DataPart(BaseModel):
     """Structured data part."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["data"] = "data"
     data: dict[str, Any]
 
@@ -36,6 +53,8 @@ class DataPart(BaseModel):
 class FilePart(BaseModel):
     """File content part."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["file"] = "file"
     file: dict[str, Any]  # Contains name, mimeType, bytes/uri
 
@@ -50,28 +69,61 @@ class Message(BaseModel):
     parts: list[Part]
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    _serialized_parts: list[dict[str, Any]] | None = PrivateAttr(default=None)
+
+    def dump_parts(self) -> list[dict[str, Any]]:
+        """Serialized parts, memoized.
+
+        Parts are fixed once the message is built, so forwarding the same
+        message to N peers serializes it once instead of N times.
+        """
+        if self._serialized_parts is None:
+            self._serialized_parts = [p.model_dump() for p in self.parts]
+        return self._serialized_parts
+
 
 class Task(BaseModel):
     """A2A Task representing a unit of work."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
-    session_id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_fast_id)
+    session_id: str = Field(default_factory=_fast_id)
     status: TaskState = TaskState.SUBMITTED
     history: list[Message] = Field(default_factory=list)
     artifacts: list[dict[str, Any]] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Stored as integer nanoseconds: timestamping a task or message append
+    # is a single clock read, with no datetime allocation on the hot path.
+    created_at_ns: int = Field(default_factory=time.time_ns)
+    updated_at_ns: int = Field(default_factory=time.time_ns)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as an aware datetime (computed on demand)."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=UTC)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Last-update time as an aware datetime (computed on demand)."""
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9, tz=UTC)
+
+    @field_serializer("created_at_ns", "updated_at_ns", when_used="json")
+    def _serialize_timestamp(self, value: int) -> str:
+        return datetime.fromtimestamp(value / 1e9, tz=UTC).isoformat()
 
     def add_message(self, role: Literal["user", "agent"], text: str) -> None:
         """Add a text message to history."""
         self.history.append(Message(role=role, parts=[TextPart(text=text)]))
-        self.updated_at = datetime.now(UTC)
+        self.updated_at_ns = time.time_ns()
 
     def add_data(self, role: Literal["user", "agent"], data: dict[str, Any]) -> None:
         """Add structured data to history."""
         self.history.append(Message(role=role, parts=[DataPart(data=data)]))
-        self.updated_at = datetime.now(UTC)
+        self.updated_at_ns = time.time_ns()
+
+
+# Serializes a whole history in one pydantic-core pass instead of
+# per-part model_dump() calls in nested comprehensions.
+MESSAGE_LIST_ADAPTER: TypeAdapter[list[Message]] = TypeAdapter(list[Message])
 
 
 class Skill(BaseModel):
@@ -108,8 +160,10 @@ class AgentCard(BaseModel):
 class A2AMessage(BaseModel):
     """Top-level A2A protocol message."""
 
+    model_config = ConfigDict(frozen=True)
+
     jsonrpc: str = "2.0"
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_fast_id)
     method: str
     params: dict[str, Any] = Field(default_factory=dict)
 
@@ -117,6 +171,8 @@ class A2AMessage(BaseModel):
 class A2AResponse(BaseModel):
     """A2A protocol response."""
 
+    model_config = ConfigDict(frozen=True)
+
     jsonrpc: str = "2.0"
     id: str
     result: dict[str, Any] | None = None
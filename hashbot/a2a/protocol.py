@@ -1,10 +1,14 @@
 """A2A Protocol core implementation."""
 
+import asyncio
+import time
 from typing import Any
 
 import httpx
+from pydantic import TypeAdapter
 
 from hashbot.a2a.messages import (
+    MESSAGE_LIST_ADAPTER,
     A2AMessage,
     A2AResponse,
     AgentCard,
@@ -12,38 +16,100 @@ from hashbot.a2a.messages import (
     TaskState,
 )
 
+_RESPONSE_LIST_ADAPTER: TypeAdapter[list[A2AResponse]] = TypeAdapter(list[A2AResponse])
+_MESSAGE_BATCH_ADAPTER: TypeAdapter[list[A2AMessage]] = TypeAdapter(list[A2AMessage])
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled client for the whole process: every A2AProtocol instance
+# reuses the same warm TCP/TLS connections instead of paying handshake
+# latency per instance.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide HTTP client."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client. Call from application shutdown."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 class A2AProtocol:
     """A2A Protocol client for inter-agent communication."""
 
+    # Agent cards change rarely (version bumps only), so cache them.
+    _discovery_ttl: float = 300.0
+
     def __init__(self, agent_card: AgentCard):
         self.agent_card = agent_card
-        self._http_client: httpx.AsyncClient | None = None
+        # url -> (fetched_at, etag, card)
+        self._discovery_cache: dict[str, tuple[float, str | None, AgentCard]] = {}
+        self._discovery_locks: dict[str, asyncio.Lock] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
-        return self._http_client
+        """Get the shared HTTP client."""
+        return _get_shared_client()
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Close the shared HTTP client."""
+        await close_shared_client()
 
     async def discover_agent(self, agent_url: str) -> AgentCard | None:
-        """Discover agent capabilities via Agent Card."""
-        client = await self._get_client()
-        try:
-            # Try well-known location first
-            card_url = f"{agent_url.rstrip('/')}/.well-known/agent.json"
-            response = await client.get(card_url)
-            if response.status_code == 200:
-                return AgentCard.model_validate(response.json())
-        except Exception:
-            pass
-        return None
+        """Discover agent capabilities via Agent Card.
+
+        Results are memoized per URL with a TTL; concurrent discoveries of
+        the same URL coalesce onto a single in-flight request. A stale
+        entry is revalidated with If-None-Match so a 304 refreshes the
+        cache without re-parsing the card.
+        """
+        cached = self._discovery_cache.get(agent_url)
+        if cached and time.monotonic() - cached[0] < self._discovery_ttl:
+            return cached[2]
+
+        lock = self._discovery_locks.setdefault(agent_url, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have refreshed while we waited.
+            cached = self._discovery_cache.get(agent_url)
+            if cached and time.monotonic() - cached[0] < self._discovery_ttl:
+                return cached[2]
+
+            client = await self._get_client()
+            try:
+                # Try well-known location first
+                card_url = f"{agent_url.rstrip('/')}/.well-known/agent.json"
+                headers = {}
+                if cached and cached[1]:
+                    headers["If-None-Match"] = cached[1]
+                response = await client.get(card_url, headers=headers)
+                if response.status_code == 304 and cached:
+                    card = cached[2]
+                    self._discovery_cache[agent_url] = (time.monotonic(), cached[1], card)
+                    return card
+                if response.status_code == 200:
+                    card = AgentCard.model_validate(response.json())
+                    etag = response.headers.get("ETag")
+                    self._discovery_cache[agent_url] = (time.monotonic(), etag, card)
+                    return card
+            except Exception:
+                pass
+            return None
 
     async def send_task(
         self,
@@ -60,9 +126,7 @@ class A2AProtocol:
                 "sessionId": task.session_id,
                 "message": {
                     "role": "user",
-                    "parts": [p.model_dump() for p in task.history[-1].parts]
-                    if task.history
-                    else [],
+                    "parts": task.history[-1].dump_parts() if task.history else [],
                 },
                 "metadata": task.metadata,
             },
@@ -70,11 +134,68 @@ class A2AProtocol:
 
         response = await client.post(
             target_url,
-            json=message.model_dump(),
-            headers={"Content-Type": "application/json"},
+            content=message.model_dump_json().encode(),
+            headers=_JSON_HEADERS,
+        )
+
+        return A2AResponse.model_validate_json(response.content)
+
+    async def send_batch(
+        self,
+        target_url: str,
+        messages: list[A2AMessage],
+    ) -> list[A2AResponse]:
+        """Send several JSON-RPC messages to a peer as one batch request.
+
+        JSON-RPC 2.0 batch semantics: a list payload, answered with a list
+        of responses. Saves N-1 round trips when fanning out to one peer.
+        """
+        client = await self._get_client()
+
+        response = await client.post(
+            target_url,
+            content=_MESSAGE_BATCH_ADAPTER.dump_json(messages),
+            headers=_JSON_HEADERS,
+        )
+
+        return _RESPONSE_LIST_ADAPTER.validate_json(response.content)
+
+    async def broadcast_task(
+        self,
+        target_urls: list[str],
+        task: Task,
+        *,
+        concurrency: int = 32,
+    ) -> list[A2AResponse]:
+        """Send the same task to several peers concurrently.
+
+        The message is serialized once and the POSTs run in parallel under
+        a bounded semaphore, all on the shared connection pool. Responses
+        are returned in target order.
+        """
+        client = await self._get_client()
+
+        message = A2AMessage(
+            method="tasks/send",
+            params={
+                "id": task.id,
+                "sessionId": task.session_id,
+                "message": {
+                    "role": "user",
+                    "parts": task.history[-1].dump_parts() if task.history else [],
+                },
+                "metadata": task.metadata,
+            },
         )
+        body = message.model_dump_json().encode()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _send_one(url: str) -> A2AResponse:
+            async with semaphore:
+                response = await client.post(url, content=body, headers=_JSON_HEADERS)
+                return A2AResponse.model_validate_json(response.content)
 
-        return A2AResponse.model_validate(response.json())
+        return list(await asyncio.gather(*(_send_one(url) for url in target_urls)))
 
     async def get_task(self, target_url: str, task_id: str) -> A2AResponse:
         """Get task status from another agent."""
@@ -87,11 +208,11 @@ class A2AProtocol:
 
         response = await client.post(
             target_url,
-            json=message.model_dump(),
-            headers={"Content-Type": "application/json"},
+            content=message.model_dump_json().encode(),
+            headers=_JSON_HEADERS,
         )
 
-        return A2AResponse.model_validate(response.json())
+        return A2AResponse.model_validate_json(response.content)
 
     async def cancel_task(self, target_url: str, task_id: str) -> A2AResponse:
         """Cancel a task on another agent."""
@@ -104,11 +225,11 @@ class A2AProtocol:
 
         response = await client.post(
             target_url,
-            json=message.model_dump(),
-            headers={"Content-Type": "application/json"},
+            content=message.model_dump_json().encode(),
+            headers=_JSON_HEADERS,
         )
 
-        return A2AResponse.model_validate(response.json())
+        return A2AResponse.model_validate_json(response.content)
 
     def create_task(self, text: str, metadata: dict[str, Any] | None = None) -> Task:
         """Create a new task with initial message."""
@@ -130,13 +251,7 @@ class A2AProtocol:
             "id": task.id,
             "sessionId": task.session_id,
             "status": {"state": status.value},
-            "history": [
-                {
-                    "role": m.role,
-                    "parts": [p.model_dump() for p in m.parts],
-                }
-                for m in task.history
-            ],
+            "history": MESSAGE_LIST_ADAPTER.dump_python(task.history, mode="json"),
             "metadata": task.metadata,
         }
 
@@ -162,3 +277,61 @@ class A2AProtocol:
             "inputSchema": input_schema,
             "metadata": task.metadata,
         }
+
+
+class BatchingA2AProtocol:
+    """Context manager that buffers outbound messages into JSON-RPC batches.
+
+    Messages enqueued for the same target are flushed as one batch request
+    when the buffer reaches ``max_batch`` or the context exits.
+
+    Usage:
+        async with BatchingA2AProtocol(protocol) as batcher:
+            fut1 = await batcher.enqueue(url, message1)
+            fut2 = await batcher.enqueue(url, message2)
+        response1, response2 = fut1.result(), fut2.result()
+    """
+
+    def __init__(self, protocol: A2AProtocol, max_batch: int = 32):
+        self.protocol = protocol
+        self.max_batch = max_batch
+        self._buffers: dict[str, list[tuple[A2AMessage, asyncio.Future[A2AResponse]]]] = {}
+
+    async def enqueue(
+        self, target_url: str, message: A2AMessage
+    ) -> asyncio.Future[A2AResponse]:
+        """Buffer a message; returns a future resolved on flush."""
+        future: asyncio.Future[A2AResponse] = asyncio.get_running_loop().create_future()
+        buffer = self._buffers.setdefault(target_url, [])
+        buffer.append((message, future))
+        if len(buffer) >= self.max_batch:
+            await self._flush_target(target_url)
+        return future
+
+    async def flush(self) -> None:
+        """Flush all buffered targets."""
+        for target_url in list(self._buffers):
+            await self._flush_target(target_url)
+
+    async def _flush_target(self, target_url: str) -> None:
+        buffer = self._buffers.pop(target_url, [])
+        if not buffer:
+            return
+        messages = [m for m, _ in buffer]
+        try:
+            responses = await self.protocol.send_batch(target_url, messages)
+        except Exception as e:
+            for _, future in buffer:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        by_id = {r.id: r for r in responses}
+        for message, future in buffer:
+            if not future.done():
+                future.set_result(by_id.get(message.id))
+
+    async def __aenter__(self) -> "BatchingA2AProtocol":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.flush()
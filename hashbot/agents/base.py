@@ -3,9 +3,10 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from decimal import Decimal
+from functools import cached_property
 from typing import Any, TypeVar
 
-from hashbot.a2a.messages import AgentCard, Skill, Task, TaskState
+from hashbot.a2a.messages import MESSAGE_LIST_ADAPTER, AgentCard, Skill, Task, TaskState
 from hashbot.x402.payment import PaymentConfig
 
 T = TypeVar("T", bound="BaseAgent")
@@ -110,8 +111,13 @@ class BaseAgent(ABC):
             description=f"Payment for {self.name}",
         )
 
-    def get_agent_card(self) -> AgentCard:
-        """Build A2A Agent Card."""
+    @cached_property
+    def agent_card(self) -> AgentCard:
+        """A2A Agent Card, built once per instance.
+
+        Agent metadata is class-level and immutable after the @agent_card
+        decorator runs, so the card never changes for a given instance.
+        """
         skills = [
             Skill(
                 id=s.get("id", "default"),
@@ -146,6 +152,10 @@ class BaseAgent(ABC):
             },
         )
 
+    def get_agent_card(self) -> AgentCard:
+        """Get the A2A Agent Card (cached)."""
+        return self.agent_card
+
     @abstractmethod
     async def process(self, task: Task) -> dict[str, Any]:
         """
@@ -162,6 +172,19 @@ class BaseAgent(ABC):
         """
         pass
 
+    @staticmethod
+    def _latest_user_text(task: Task) -> str:
+        """Extract the text of the first text-bearing part of the last message.
+
+        Uses a defaulted ``getattr`` instead of a ``hasattr`` probe so each
+        part costs one attribute lookup rather than two.
+        """
+        parts = task.history[-1].parts if task.history else ()
+        return next(
+            (text for part in parts if (text := getattr(part, "text", None)) is not None),
+            "",
+        )
+
     async def handle_task(self, task: Task) -> dict[str, Any]:
         """
         Handle a task with payment check.
@@ -183,15 +206,17 @@ class BaseAgent(ABC):
         except Exception as e:
             return self._create_error_response(task, str(e))
 
-    def _create_payment_required_response(self, task: Task) -> dict[str, Any]:
-        """Create x402 payment required response."""
-        config = self.get_payment_config()
+    @cached_property
+    def _payment_required_template(self) -> dict[str, Any]:
+        """Static part of the x402 payment-required response.
 
-        task.status = TaskState.INPUT_REQUIRED
+        Price and currency are fixed per agent, so the PaymentConfig build
+        and requirements dump happen once per instance, not per rejected
+        request.
+        """
+        config = self.get_payment_config()
 
         return {
-            "id": task.id,
-            "sessionId": task.session_id,
             "status": {
                 "state": TaskState.INPUT_REQUIRED.value,
                 "message": {
@@ -211,6 +236,16 @@ class BaseAgent(ABC):
                     ],
                 },
             },
+        }
+
+    def _create_payment_required_response(self, task: Task) -> dict[str, Any]:
+        """Create x402 payment required response."""
+        task.status = TaskState.INPUT_REQUIRED
+
+        return {
+            **self._payment_required_template,
+            "id": task.id,
+            "sessionId": task.session_id,
             "metadata": task.metadata,
         }
 
@@ -250,10 +285,7 @@ class BaseAgent(ABC):
             "id": task.id,
             "sessionId": task.session_id,
             "status": {"state": TaskState.COMPLETED.value},
-            "history": [
-                {"role": m.role, "parts": [p.model_dump() for p in m.parts]}
-                for m in task.history
-            ]
+            "history": MESSAGE_LIST_ADAPTER.dump_python(task.history, mode="json")
             + [{"role": "agent", "parts": parts}],
             "metadata": task.metadata,
         }
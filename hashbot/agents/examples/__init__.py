@@ -1,11 +1,28 @@
-"""Example agents for HashBot."""
+"""Example agents for HashBot.
 
-from hashbot.agents.examples.code_reviewer import CodeReviewerAgent
-from hashbot.agents.examples.crypto_analyst import CryptoAnalystAgent
-from hashbot.agents.examples.translator import TranslatorAgent
+Agents are imported lazily (PEP 562) so a server that only enables one
+agent doesn't pay import-time cost for the others.
+"""
+
+import importlib
 
 __all__ = [
     "CryptoAnalystAgent",
     "TranslatorAgent",
     "CodeReviewerAgent",
 ]
+
+_LAZY_AGENTS = {
+    "CryptoAnalystAgent": "crypto_analyst",
+    "TranslatorAgent": "translator",
+    "CodeReviewerAgent": "code_reviewer",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_AGENTS:
+        module = importlib.import_module(f".{_LAZY_AGENTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
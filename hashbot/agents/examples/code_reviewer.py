@@ -1,11 +1,66 @@
 """Code Reviewer Agent - Smart contract and code audit."""
 
+import re
 from typing import Any
 
-from hashbot.a2a.messages import Task
+from hashbot.a2a.messages import Task, TaskState
 from hashbot.agents.base import BaseAgent, agent_card
 from hashbot.agents.registry import register_agent
 
+# Single compiled scan over the code instead of one substring search per
+# language marker; the first marker hit decides the language.
+_LANGUAGE_MARKERS = re.compile(r"pragma solidity|contract |def |import |function|const ")
+_MARKER_LANGUAGE = {
+    "pragma solidity": "solidity",
+    "contract ": "solidity",
+    "def ": "python",
+    "import ": "python",
+    "function": "javascript",
+    "const ": "javascript",
+}
+
+# Canned review content, hoisted so the hot path never rebuilds it.
+_SOLIDITY_ISSUES = [
+    {
+        "severity": "medium",
+        "title": "Reentrancy Risk",
+        "description": "Consider using ReentrancyGuard for external calls",
+    },
+    {
+        "severity": "low",
+        "title": "Gas Optimization",
+        "description": "Use `++i` instead of `i++` in loops",
+    },
+    {
+        "severity": "info",
+        "title": "Documentation",
+        "description": "Add NatSpec comments for public functions",
+    },
+]
+_SOLIDITY_SUGGESTIONS = [
+    "Consider using OpenZeppelin's SafeMath for arithmetic operations",
+    "Add events for state changes to improve transparency",
+    "Implement access control modifiers for admin functions",
+]
+_GENERIC_ISSUES = [
+    {
+        "severity": "info",
+        "title": "Code Style",
+        "description": "Consider adding type hints for better maintainability",
+    }
+]
+_GENERIC_SUGGESTIONS = [
+    "Add unit tests for critical functions",
+    "Consider error handling improvements",
+]
+
+_SEVERITY_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢", "info": "ℹ️"}
+_DEFAULT_EMOJI = "⚪"
+
+# One case-insensitive pass over the message instead of a lower() plus a
+# substring scan per trigger word.
+_CODE_TRIGGER_RE = re.compile(r"function|contract", re.IGNORECASE)
+
 
 @register_agent("code_reviewer")
 @agent_card(
@@ -34,14 +89,28 @@ from hashbot.agents.registry import register_agent
 class CodeReviewerAgent(BaseAgent):
     """AI code review and audit agent."""
 
+    _HELP_TEXT = (
+        "**Code Review Service**\n\n"
+        "Send me code to review. I can:\n"
+        "• Audit Solidity smart contracts\n"
+        "• Review Python, JavaScript, TypeScript code\n"
+        "• Identify security vulnerabilities\n"
+        "• Suggest gas optimizations\n"
+        "• Check best practices\n\n"
+        "Just paste your code in a code block:\n"
+        "```solidity\n"
+        "// your code here\n"
+        "```"
+    )
+    # Static response shell; per-task fields are merged in at return time.
+    _STATIC_HELP_PAYLOAD = {
+        "status": {"state": TaskState.COMPLETED.value},
+        "history": [{"role": "agent", "parts": [{"type": "text", "text": _HELP_TEXT}]}],
+    }
+
     async def process(self, task: Task) -> dict[str, Any]:
         """Process code review request."""
-        user_text = ""
-        if task.history:
-            for part in task.history[-1].parts:
-                if hasattr(part, "text"):
-                    user_text = part.text
-                    break
+        user_text = self._latest_user_text(task)
 
         # Check if code is provided
         if "```" in user_text:
@@ -53,105 +122,62 @@ class CodeReviewerAgent(BaseAgent):
                 code_block = user_text[code_start:code_end + 3]
                 return await self._review_code(task, code_block)
 
-        elif "function" in user_text.lower() or "contract" in user_text.lower():
+        elif _CODE_TRIGGER_RE.search(user_text):
             # Treat entire message as code
             return await self._review_code(task, user_text)
 
-        # Show help
-        return self._create_success_response(
-            task,
-            text="**Code Review Service**\n\n"
-            "Send me code to review. I can:\n"
-            "• Audit Solidity smart contracts\n"
-            "• Review Python, JavaScript, TypeScript code\n"
-            "• Identify security vulnerabilities\n"
-            "• Suggest gas optimizations\n"
-            "• Check best practices\n\n"
-            "Just paste your code in a code block:\n"
-            "```solidity\n"
-            "// your code here\n"
-            "```",
-        )
+        # Show help (precomputed payload: no history walk, no string rebuild)
+        task.status = TaskState.COMPLETED
+        return {
+            **self._STATIC_HELP_PAYLOAD,
+            "id": task.id,
+            "sessionId": task.session_id,
+            "metadata": task.metadata,
+        }
 
     async def _review_code(self, task: Task, code: str) -> dict[str, Any]:
         """Review the provided code."""
         # Detect language
-        language = "unknown"
-        if "pragma solidity" in code or "contract " in code:
-            language = "solidity"
-        elif "def " in code or "import " in code:
-            language = "python"
-        elif "function" in code or "const " in code:
-            language = "javascript"
+        marker = _LANGUAGE_MARKERS.search(code)
+        language = _MARKER_LANGUAGE[marker.group()] if marker else "unknown"
 
         # Generate review (placeholder for actual AI review)
-        issues = []
-        suggestions = []
-
         if language == "solidity":
-            issues = [
-                {
-                    "severity": "medium",
-                    "title": "Reentrancy Risk",
-                    "description": "Consider using ReentrancyGuard for external calls",
-                },
-                {
-                    "severity": "low",
-                    "title": "Gas Optimization",
-                    "description": "Use `++i` instead of `i++` in loops",
-                },
-                {
-                    "severity": "info",
-                    "title": "Documentation",
-                    "description": "Add NatSpec comments for public functions",
-                },
-            ]
-            suggestions = [
-                "Consider using OpenZeppelin's SafeMath for arithmetic operations",
-                "Add events for state changes to improve transparency",
-                "Implement access control modifiers for admin functions",
-            ]
+            issues = _SOLIDITY_ISSUES
+            suggestions = _SOLIDITY_SUGGESTIONS
         else:
-            issues = [
-                {
-                    "severity": "info",
-                    "title": "Code Style",
-                    "description": "Consider adding type hints for better maintainability",
-                }
-            ]
-            suggestions = [
-                "Add unit tests for critical functions",
-                "Consider error handling improvements",
-            ]
-
-        # Format review
-        review_text = f"""
+            issues = _GENERIC_ISSUES
+            suggestions = _GENERIC_SUGGESTIONS
+
+        # Format review (built via join to avoid repeated string copies)
+        sections = [
+            f"""
 **Code Review Report**
 
 **Language Detected:** {language.title()}
-**Lines Analyzed:** ~{len(code.split(chr(10)))}
+**Lines Analyzed:** ~{code.count(chr(10)) + 1}
 
 ---
 
 **Issues Found:** {len(issues)}
 
 """
+        ]
         for issue in issues:
-            severity_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢", "info": "ℹ️"}.get(
-                issue["severity"], "⚪"
-            )
-            review_text += f"{severity_emoji} **[{issue['severity'].upper()}]** {issue['title']}\n"
-            review_text += f"   {issue['description']}\n\n"
+            emoji = _SEVERITY_EMOJI.get(issue["severity"], _DEFAULT_EMOJI)
+            sections.append(f"{emoji} **[{issue['severity'].upper()}]** {issue['title']}\n")
+            sections.append(f"   {issue['description']}\n\n")
 
-        review_text += "---\n\n**Suggestions:**\n"
+        sections.append("---\n\n**Suggestions:**\n")
         for i, suggestion in enumerate(suggestions, 1):
-            review_text += f"{i}. {suggestion}\n"
+            sections.append(f"{i}. {suggestion}\n")
 
-        review_text += """
+        sections.append("""
 ---
 
 ⚠️ *This is an automated review. Manual audit recommended for production code.*
-"""
+""")
+        review_text = "".join(sections)
 
         return self._create_success_response(
             task,
@@ -1,11 +1,58 @@
 """Crypto Analyst Agent - Token analysis and market insights."""
 
+import re
 from typing import Any
 
 from hashbot.a2a.messages import Task
 from hashbot.agents.base import BaseAgent, agent_card
 from hashbot.agents.registry import register_agent
 
+# Analysis reply skeleton, compiled once; per-call rendering is a single
+# format_map over the token fields instead of an f-string rebuild.
+_TOKEN_ANALYSIS_TMPL = """
+**{name} ({symbol}) Analysis**
+
+📊 **Current Price:** ${price:,.2f}
+📈 **24h Change:** {change_sign}{change_24h}%
+💰 **Market Cap:** ${market_cap}
+
+**Technical Indicators:**
+• RSI (14): 55
+• MACD: {macd}
+• Moving Average: {ma_position} 50-day MA
+
+**Recommendation:** {recommendation}
+**Confidence:** {confidence_pct:.0f}%
+
+⚠️ *This is AI-generated analysis for educational purposes only. Not financial advice.*
+""".strip()
+
+# Static market-overview reply, rendered (and stripped) once at import time;
+# the top-movers block is ranked from the SoA arrays below the class.
+_MARKET_OVERVIEW_TMPL = """
+**Crypto Market Overview**
+
+📊 **Market Sentiment:** Bullish (Fear & Greed Index: 72)
+
+**Top Movers (24h):**
+{top_movers}
+
+**Market Stats:**
+• Total Market Cap: $2.45T
+• 24h Volume: $89B
+• BTC Dominance: 52.3%
+
+**Key Events:**
+• HashKey Chain mainnet upgrade scheduled
+• ETH ETF trading volume increasing
+• BTC halving effects continuing
+
+**AI Outlook:** Generally bullish conditions with institutional interest
+remaining strong. Consider DCA strategy for long-term holdings.
+
+⚠️ *AI analysis for educational purposes only.*
+""".strip()
+
 
 @register_agent("crypto_analyst")
 @agent_card(
@@ -62,75 +109,69 @@ class CryptoAnalystAgent(BaseAgent):
         },
     }
 
+    # Structure-of-arrays view of MOCK_TOKENS: parallel tuples make ranking
+    # and aggregation a flat-sequence pass instead of per-token dict hops,
+    # and swap cleanly for numpy arrays once a real feed replaces the mocks.
+    _SYMBOLS = tuple(MOCK_TOKENS)
+    _PRICES = tuple(t["price"] for t in MOCK_TOKENS.values())
+    _CHANGES = tuple(t["change_24h"] for t in MOCK_TOKENS.values())
+    _RECOMMENDATIONS = tuple(t["recommendation"] for t in MOCK_TOKENS.values())
+
+    # One case-insensitive scan classifies the message: a token symbol
+    # triggers analysis, "market"/"overview" triggers the overview.
+    _INTENT_RE = re.compile(
+        rf"\b({'|'.join(MOCK_TOKENS)})\b|\b(market|overview)\b", re.IGNORECASE
+    )
+
     async def process(self, task: Task) -> dict[str, Any]:
         """Process analysis request."""
         # Extract user message
-        user_text = ""
-        if task.history:
-            for part in task.history[-1].parts:
-                if hasattr(part, "text"):
-                    user_text = part.text
-                    break
+        user_text = self._latest_user_text(task)
 
         # Determine skill based on message
-        user_text_lower = user_text.lower()
+        match = self._INTENT_RE.search(user_text)
 
-        if any(
-            token.lower() in user_text_lower for token in self.MOCK_TOKENS.keys()
-        ):
-            # Token analysis
-            for token in self.MOCK_TOKENS.keys():
-                if token.lower() in user_text_lower:
-                    return await self._analyze_token(task, token)
-
-        elif "market" in user_text_lower or "overview" in user_text_lower:
+        if match:
+            token = match.group(1)
+            if token:
+                # Token analysis
+                return await self._analyze_token(task, token.upper())
             # Market overview
             return await self._market_overview(task)
 
-        else:
-            # Default: ask for specific token
-            return self._create_success_response(
-                task,
-                text="Which token would you like me to analyze? "
-                "I can analyze BTC, ETH, HSK and more. "
-                "Or ask for a 'market overview'.",
-            )
+        # Default: ask for specific token
+        return self._create_success_response(
+            task,
+            text="Which token would you like me to analyze? "
+            "I can analyze BTC, ETH, HSK and more. "
+            "Or ask for a 'market overview'.",
+        )
 
     async def _analyze_token(self, task: Task, symbol: str) -> dict[str, Any]:
-        """Analyze a specific token."""
-        token_data = self.MOCK_TOKENS.get(symbol.upper(), {})
-
-        if not token_data:
-            return self._create_success_response(
-                task,
-                text=f"Token {symbol} not found in my database. "
-                "Try BTC, ETH, or HSK.",
-            )
-
-        # Generate analysis
-        analysis = f"""
-**{token_data['name']} ({symbol.upper()}) Analysis**
-
-📊 **Current Price:** ${token_data['price']:,.2f}
-📈 **24h Change:** {'+' if token_data['change_24h'] > 0 else ''}{token_data['change_24h']}%
-💰 **Market Cap:** ${token_data['market_cap']}
-
-**Technical Indicators:**
-• RSI (14): 55
-• MACD: {'Bullish' if token_data['change_24h'] > 0 else 'Bearish'}
-• Moving Average: {'Above' if token_data['change_24h'] > 0 else 'Below'} 50-day MA
-
-**Recommendation:** {token_data['recommendation']}
-**Confidence:** {token_data['confidence'] * 100:.0f}%
-
-⚠️ *This is AI-generated analysis for educational purposes only. Not financial advice.*
-"""
+        """Analyze a specific token.
+
+        ``symbol`` is already canonical uppercase — the caller only passes
+        symbols matched against MOCK_TOKENS keys — so this is a direct hit.
+        """
+        token_data = self.MOCK_TOKENS[symbol]
+        rising = token_data["change_24h"] > 0
+
+        analysis = _TOKEN_ANALYSIS_TMPL.format_map(
+            {
+                **token_data,
+                "symbol": symbol,
+                "change_sign": "+" if rising else "",
+                "macd": "Bullish" if rising else "Bearish",
+                "ma_position": "Above" if rising else "Below",
+                "confidence_pct": token_data["confidence"] * 100,
+            }
+        )
 
         return self._create_success_response(
             task,
-            text=analysis.strip(),
+            text=analysis,
             data={
-                "symbol": symbol.upper(),
+                "symbol": symbol,
                 "price": token_data["price"],
                 "change_24h": token_data["change_24h"],
                 "recommendation": token_data["recommendation"],
@@ -140,35 +181,9 @@ class CryptoAnalystAgent(BaseAgent):
 
     async def _market_overview(self, task: Task) -> dict[str, Any]:
         """Generate market overview."""
-        overview = """
-**Crypto Market Overview**
-
-📊 **Market Sentiment:** Bullish (Fear & Greed Index: 72)
-
-**Top Movers (24h):**
-• HSK: +5.8% 🚀
-• ETH: +3.2% 📈
-• BTC: +2.5% 📈
-
-**Market Stats:**
-• Total Market Cap: $2.45T
-• 24h Volume: $89B
-• BTC Dominance: 52.3%
-
-**Key Events:**
-• HashKey Chain mainnet upgrade scheduled
-• ETH ETF trading volume increasing
-• BTC halving effects continuing
-
-**AI Outlook:** Generally bullish conditions with institutional interest
-remaining strong. Consider DCA strategy for long-term holdings.
-
-⚠️ *AI analysis for educational purposes only.*
-"""
-
         return self._create_success_response(
             task,
-            text=overview.strip(),
+            text=_MARKET_OVERVIEW_TEXT,
             data={
                 "sentiment": "bullish",
                 "fear_greed_index": 72,
@@ -176,3 +191,18 @@ remaining strong. Consider DCA strategy for long-term holdings.
                 "btc_dominance": 52.3,
             },
         )
+
+
+def _render_top_movers() -> str:
+    """Rank tokens by 24h change over the SoA arrays and format the top 3."""
+    symbols = CryptoAnalystAgent._SYMBOLS
+    changes = CryptoAnalystAgent._CHANGES
+    ranked = sorted(range(len(symbols)), key=changes.__getitem__, reverse=True)
+    return "\n".join(
+        f"• {symbols[i]}: {changes[i]:+.1f}% "
+        f"{'🚀' if changes[i] >= 5 else '📈' if changes[i] > 0 else '📉'}"
+        for i in ranked[:3]
+    )
+
+
+_MARKET_OVERVIEW_TEXT = _MARKET_OVERVIEW_TMPL.format(top_movers=_render_top_movers())
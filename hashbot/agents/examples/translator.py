@@ -40,6 +40,25 @@ class TranslatorAgent(BaseAgent):
         "hi": "Hindi",
     }
 
+    # Maps every accepted alias (code, lowercase name, 3-letter prefix) to
+    # the language code, so resolution is one dict hit instead of a scan.
+    _LANG_INDEX: dict[str, str] = {}
+    for _code, _name in SUPPORTED_LANGUAGES.items():
+        _LANG_INDEX[_code] = _code
+        _LANG_INDEX[_name.lower()] = _code
+        _LANG_INDEX[_name.lower()[:3]] = _code
+    del _code, _name
+
+    _LANGUAGES_LIST = ", ".join(
+        f"{name} ({code})" for code, name in SUPPORTED_LANGUAGES.items()
+    )
+    _HELP_TEXT = (
+        "**Translation Service**\n\n"
+        "Usage: `translate [text] to [language]`\n\n"
+        "Example: `translate hello to Chinese`\n\n"
+        f"Supported languages: {_LANGUAGES_LIST}"
+    )
+
     # Demo translations (in real implementation, use actual translation API)
     DEMO_TRANSLATIONS = {
         ("hello", "zh"): "你好",
@@ -53,48 +72,29 @@ class TranslatorAgent(BaseAgent):
 
     async def process(self, task: Task) -> dict[str, Any]:
         """Process translation request."""
-        user_text = ""
-        if task.history:
-            for part in task.history[-1].parts:
-                if hasattr(part, "text"):
-                    user_text = part.text
-                    break
+        user_text = self._latest_user_text(task)
 
         # Parse translation request
         # Format: "translate [text] to [language]"
         user_lower = user_text.lower()
 
-        if "to " in user_lower:
-            parts = user_lower.split(" to ")
-            if len(parts) >= 2:
-                text_part = parts[0].replace("translate ", "").strip()
-                target_lang = parts[-1].strip()
-
-                # Find language code
-                lang_code = None
-                for code, name in self.SUPPORTED_LANGUAGES.items():
-                    if (
-                        target_lang == code
-                        or target_lang == name.lower()
-                        or target_lang.startswith(name.lower()[:3])
-                    ):
-                        lang_code = code
-                        break
-
-                if lang_code:
-                    return await self._translate(task, text_part, lang_code)
+        # One C-level scan from the right instead of splitting every " to "
+        # into a throwaway list; the language always follows the last "to".
+        text_part, sep, target_lang = user_lower.rpartition(" to ")
+        if sep:
+            text_part = text_part.replace("translate ", "").strip()
+            target_lang = target_lang.strip()
+
+            # Find language code via the prebuilt alias index
+            lang_code = self._LANG_INDEX.get(target_lang) or self._LANG_INDEX.get(
+                target_lang[:3]
+            )
+
+            if lang_code:
+                return await self._translate(task, text_part, lang_code)
 
         # Show help
-        languages = ", ".join(
-            [f"{name} ({code})" for code, name in self.SUPPORTED_LANGUAGES.items()]
-        )
-        return self._create_success_response(
-            task,
-            text=f"**Translation Service**\n\n"
-            f"Usage: `translate [text] to [language]`\n\n"
-            f"Example: `translate hello to Chinese`\n\n"
-            f"Supported languages: {languages}",
-        )
+        return self._create_success_response(task, text=self._HELP_TEXT)
 
     async def _translate(
         self, task: Task, text: str, target_lang: str
@@ -1,10 +1,24 @@
 """Agent registry for managing available agents."""
 
+import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from hashbot.a2a.messages import AgentCard, Task
 from hashbot.agents.base import BaseAgent
 
+# Static shape of the "agent not found" failure; process_task patches in the
+# per-task fields instead of rebuilding the nested literal on every miss.
+_NOT_FOUND = {
+    "status": {
+        "state": "failed",
+        "message": {
+            "role": "agent",
+            "parts": [{"type": "text", "text": ""}],
+        },
+    },
+}
+
 
 class AgentRegistry:
     """Registry for managing and discovering agents."""
@@ -12,10 +26,38 @@ class AgentRegistry:
     def __init__(self):
         self._agents: dict[str, type[BaseAgent]] = {}
         self._instances: dict[str, BaseAgent] = {}
+        self._cards: dict[str, AgentCard] = {}
+        self._agents_display: dict[str, str] = {}
+        self._metadata: dict[str, dict[str, Any]] = {}
+        self._change_callbacks: list[Callable[[], None]] = []
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        """Register a callback fired when the agent set changes."""
+        self._change_callbacks.append(callback)
+
+    def _notify_change(self) -> None:
+        for callback in self._change_callbacks:
+            callback()
 
     def register(self, agent_id: str, agent_class: type[BaseAgent]) -> None:
         """Register an agent class."""
         self._agents[agent_id] = agent_class
+        # Cards are static @agent_card metadata; build once here instead of
+        # constructing a throwaway instance per discovery request.
+        self._cards[agent_id] = agent_class().agent_card
+        self._agents_display[agent_id] = agent_id.replace("_", " ").title()
+        # list_agents() metadata is derived from class attributes that never
+        # change after decoration; format it once here.
+        self._metadata[agent_id] = {
+            "id": agent_id,
+            "name": agent_class._agent_name,
+            "description": agent_class._agent_description,
+            "price": f"{agent_class._price_per_call} {agent_class._currency}"
+            if agent_class._price_per_call
+            else "Free",
+            "version": agent_class._version,
+        }
+        self._notify_change()
 
     def unregister(self, agent_id: str) -> None:
         """Unregister an agent."""
@@ -23,6 +65,17 @@ class AgentRegistry:
             del self._agents[agent_id]
         if agent_id in self._instances:
             del self._instances[agent_id]
+        self._cards.pop(agent_id, None)
+        self._agents_display.pop(agent_id, None)
+        self._metadata.pop(agent_id, None)
+        self._notify_change()
+
+    def display_name(self, agent_id: str) -> str:
+        """Human-readable name for an agent id, precomputed at register()."""
+        name = self._agents_display.get(agent_id)
+        if name is None:
+            name = agent_id.replace("_", " ").title()
+        return name
 
     def get_agent_class(self, agent_id: str) -> type[BaseAgent] | None:
         """Get agent class by ID."""
@@ -41,35 +94,41 @@ class AgentRegistry:
 
         return self._instances[agent_id]
 
+    async def warmup(self, base_url: str = "") -> None:
+        """Instantiate and initialize every registered agent up front.
+
+        Moves first-call construction/initialize latency out of the
+        user-facing task path; agents registered later still lazy-init.
+        """
+        await asyncio.gather(
+            *(self.get_agent(agent_id, base_url) for agent_id in self._agents)
+        )
+
     def list_agents(self) -> list[dict[str, Any]]:
-        """List all registered agents with their metadata."""
-        agents = []
-
-        for agent_id, agent_class in self._agents.items():
-            agents.append(
-                {
-                    "id": agent_id,
-                    "name": agent_class._agent_name,
-                    "description": agent_class._agent_description,
-                    "price": f"{agent_class._price_per_call} {agent_class._currency}"
-                    if agent_class._price_per_call
-                    else "Free",
-                    "version": agent_class._version,
-                }
-            )
-
-        return agents
+        """List all registered agents with their metadata (precomputed)."""
+        return list(self._metadata.values())
 
-    def get_agent_cards(self, base_url: str = "") -> list[AgentCard]:
-        """Get agent cards for all registered agents."""
-        cards = []
+    async def list_agents_batch(self) -> list[dict[str, Any]]:
+        """List agent metadata with per-agent lookups fanned out concurrently.
+
+        Metadata is local and precomputed today, but against a remote
+        registry each lookup becomes a network call; a single gather keeps
+        that at one RTT instead of N sequential ones.
+        """
+
+        async def _entry(agent_id: str) -> dict[str, Any]:
+            return self._metadata[agent_id]
 
-        for agent_id, agent_class in self._agents.items():
-            # Create temporary instance to get card
-            agent = agent_class(base_url=f"{base_url}/agents/{agent_id}")
-            cards.append(agent.get_agent_card())
+        return list(
+            await asyncio.gather(*(_entry(agent_id) for agent_id in self._metadata))
+        )
 
-        return cards
+    def get_agent_cards(self, base_url: str = "") -> list[AgentCard]:
+        """Get agent cards for all registered agents."""
+        return [
+            card.model_copy(update={"url": f"{base_url}/agents/{agent_id}"})
+            for agent_id, card in self._cards.items()
+        ]
 
     async def process_task(
         self,
@@ -81,14 +140,17 @@ class AgentRegistry:
         agent = await self.get_agent(agent_id, base_url)
 
         if not agent:
+            status = _NOT_FOUND["status"]
             return {
                 "id": task.id,
                 "sessionId": task.session_id,
                 "status": {
-                    "state": "failed",
+                    **status,
                     "message": {
-                        "role": "agent",
-                        "parts": [{"type": "text", "text": f"Agent not found: {agent_id}"}],
+                        **status["message"],
+                        "parts": [
+                            {"type": "text", "text": f"Agent not found: {agent_id}"}
+                        ],
                     },
                 },
             }
@@ -102,23 +164,21 @@ class AgentRegistry:
         self._instances.clear()
 
 
-# Global registry instance
-_registry: AgentRegistry | None = None
+# Global registry instance, constructed eagerly at import time: no lazy-init
+# branch on every access and no racy first call.
+REGISTRY = AgentRegistry()
 
 
 def get_registry() -> AgentRegistry:
-    """Get global agent registry."""
-    global _registry
-    if _registry is None:
-        _registry = AgentRegistry()
-    return _registry
+    """Get the global agent registry (the eagerly-built ``REGISTRY``)."""
+    return REGISTRY
 
 
 def register_agent(agent_id: str):
     """Decorator to register an agent class."""
 
     def decorator(cls: type[BaseAgent]) -> type[BaseAgent]:
-        get_registry().register(agent_id, cls)
+        REGISTRY.register(agent_id, cls)
         return cls
 
     return decorator
@@ -1,6 +1,10 @@
 """Telegram Bot message handlers."""
 
+import asyncio
+import functools
 import re
+import time
+from collections import defaultdict
 from decimal import Decimal
 from typing import Any
 
@@ -18,7 +22,7 @@ from telegram.ext import (
 from hashbot.bot.keyboards import InlineKeyboards
 from hashbot.config import get_settings
 from hashbot.db.crud import UserCRUD, AgentCRUD, TaskCRUD
-from hashbot.db.database import get_db
+from hashbot.db.engine import get_db
 from hashbot.services.wallet_service import WalletService
 from hashbot.services.payment_service import PaymentService
 from hashbot.openclaw.client import OpenClawClient
@@ -26,9 +30,185 @@ from hashbot.openclaw.manager import OpenClawManager
 from hashbot.openclaw.skills import list_skills, get_skill
 
 
+# Precompiled /pay argument validators: a failed match is a cheap None
+# instead of a Decimal/ValueError round-trip on the (common) bad path.
+_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+_AMOUNT_RE = re.compile(r"\d{1,18}(\.\d{1,18})?")
+
+# Decimal is immutable, so one parsed zero serves every balance fallback.
+_ZERO = Decimal("0.00")
+
+# Static command replies, rendered once at import time.
+_START_TEXT = (
+    "\U0001f916 **Welcome to HashBot!**\n"
+    "\n"
+    "Bot 用 Bot，自动付费 — Agent Economy on HashKey Chain\n"
+    "\n"
+    "**What I can do:**\n"
+    "• `/agents` - Browse available AI agents\n"
+    "• `/wallet` - Manage your wallet\n"
+    "• `/balance` - Check your HKDC balance\n"
+    "• `/pay` - Make a payment\n"
+    "\n"
+    "**How it works:**\n"
+    "1. Choose an Agent to help you\n"
+    "2. Agent requests payment (x402)\n"
+    "3. Pay with HKDC stablecoin\n"
+    "4. Get your result!\n"
+    "\n"
+    "Start by exploring `/agents` \U0001f447"
+)
+_START_KB = InlineKeyboards.main_menu()
+
+_HELP_TEXT = (
+    "\U0001f4d6 **HashBot Help**\n"
+    "\n"
+    "**Commands:**\n"
+    "• `/start` - Start the bot\n"
+    "• `/agents` - List available agents\n"
+    "• `/wallet` - Wallet management\n"
+    "• `/balance` - Check HKDC balance\n"
+    "• `/pay <address> <amount>` - Send HKDC\n"
+    "\n"
+    "**About x402 Payments:**\n"
+    "When you use a paid agent, it will request payment automatically.\n"
+    "You'll see the price before confirming.\n"
+    "\n"
+    "**About A2A Protocol:**\n"
+    "HashBot uses Google's A2A protocol for agent communication.\n"
+    "Your agents can be called by other agents too!\n"
+    "\n"
+    "**HashKey Chain:**\n"
+    "All payments are settled on HashKey Chain with HKDC stablecoin.\n"
+    "Low fees, fast confirmation, fully compliant.\n"
+    "\n"
+    "Need more help? Contact @hashbot_support"
+)
+
+# /agents screen pieces: header, per-entry formatter, and the fallback list
+# shown when no registry is wired in — all shared by the command and the
+# menu callback, with the fallback rendered once at import.
+_AGENTS_HEADER = "\U0001f916 **Available Agents**\n\nChoose an agent to interact with:\n"
+
+_DEFAULT_AGENTS = (
+    {
+        "id": "crypto_analyst",
+        "name": "Crypto Analyst",
+        "description": "Token analysis and market insights",
+        "price": "0.1 HKDC",
+    },
+    {
+        "id": "translator",
+        "name": "AI Translator",
+        "description": "Multi-language translation",
+        "price": "0.05 HKDC",
+    },
+    {
+        "id": "code_reviewer",
+        "name": "Code Reviewer",
+        "description": "Smart contract audit",
+        "price": "0.5 HKDC",
+    },
+)
+
+
+def _format_agent_entry(agent: dict[str, Any]) -> str:
+    return (
+        f"\n**{agent['name']}** (`{agent['id']}`)\n"
+        f"{agent['description']}\n"
+        f"\U0001f4b0 {agent['price']} per call\n"
+    )
+
+
+_DEFAULT_AGENTS_TEXT = _AGENTS_HEADER + "".join(
+    _format_agent_entry(agent) for agent in _DEFAULT_AGENTS
+)
+_DEFAULT_AGENTS_KB = InlineKeyboards.agent_list(list(_DEFAULT_AGENTS))
+
+_SKILLS_HEADER = (
+    "\U0001f6e0 **Available Skills**\n\n"
+    "Install skills to enhance your agent:\n\n"
+)
+_SKILLS_FOOTER = "Reply with skill slug to install (e.g., `hsk-crypto-price`)"
+
+
+@functools.lru_cache(maxsize=256)
+def _pretty_agent_name(agent_id: str) -> str:
+    """Fallback display name for an agent id, memoized per id."""
+    return agent_id.replace("_", " ").title()
+
+
+@functools.cache
+def _render_skills_text() -> str:
+    """Render the /skills catalogue once; the skill registry is static."""
+    parts = [_SKILLS_HEADER]
+    parts.extend(
+        f"**{skill['name']}** (`{skill['slug']}`)\n{skill['description']}\n\n"
+        for skill in list_skills()
+    )
+    parts.append(_SKILLS_FOOTER)
+    return "".join(parts)
+
+
+_NO_SESSION_HINT = (
+    "Use /agents to start chatting with an AI agent, "
+    "or /help for more options."
+)
+
+_WALLET_TMPL = (
+    "\U0001f4bc **Your Wallet**\n"
+    "\n"
+    "**Address:** `{address}`\n"
+    "**Network:** HashKey Chain {network}\n"
+    "\n"
+    "Use `/balance` to check your HKDC balance."
+)
+
+_WALLET_SETUP_TEXT = (
+    "\U0001f4bc **Wallet Setup**\n"
+    "\n"
+    "You don't have a wallet yet.\n"
+    "Click below to create one or import existing."
+)
+
+_EXPLORE_TEXT = (
+    "\U0001f50d **Explore Agent Marketplace**\n\n"
+    "Browse agents by category:\n\n"
+    "\U0001f4b9 **DeFi & Trading**\n"
+    "- Token swap agents\n"
+    "- Price analysis\n"
+    "- Portfolio management\n\n"
+    "\U0001f4dd **Content & Creative**\n"
+    "- Translation\n"
+    "- Writing assistance\n"
+    "- Image generation\n\n"
+    "\U0001f4bb **Development**\n"
+    "- Code review\n"
+    "- Smart contract audit\n"
+    "- Bug detection\n\n"
+    "Use /agents to see all available agents."
+)
+
+
 class HashBotHandler:
     """Main Telegram bot handler."""
 
+    # Callback-data prefix (before ":") -> handler method name; shared across
+    # instances, bound once per handler in __init__.
+    _CB_ROUTES = {
+        "agent": "_cb_agent",
+        "agent_new": "_cb_agent",
+        "agent_exit": "_cb_agent_exit",
+        "menu": "_cb_menu",
+        "pay_confirm": "_cb_pay_confirm",
+        "pay_cancel": "_cb_pay_cancel",
+        "x402_pay": "_cb_x402_pay",
+        "x402_cancel": "_cb_x402_cancel",
+        "wallet_create": "_cb_wallet_create",
+        "wallet_import": "_cb_wallet_import",
+        "wallet": "_cb_wallet",
+    }
+
     def __init__(
         self,
         agent_registry: Any | None = None,
@@ -44,6 +224,35 @@ class HashBotHandler:
         self.user_crud = UserCRUD()
         self.agent_crud = AgentCRUD()
         self.task_crud = TaskCRUD()
+        # Rendered /agents reply (text + keyboard); rebuilt only when the
+        # registry contents change.
+        self._agents_cache: tuple[str, Any] | None = None
+        # Per-user wallet lookup cache; Telegram clients fire commands
+        # back-to-back, so a short TTL absorbs most repeat DB hits.
+        self._wallet_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._wallet_cache_ttl = 60.0
+        # Per-user lock so a burst of button presses triggers one cold DB
+        # lookup, not one per press.
+        self._wallet_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Cap concurrent OpenClaw calls so a message spike can't exhaust the
+        # upstream gateway's rate limits or pile up pending coroutines.
+        self._openclaw_sem = asyncio.Semaphore(self.settings.openclaw_max_concurrency)
+        # Strong references to fire-and-forget tasks (the event loop only
+        # keeps weak ones).
+        self._background_tasks: set[asyncio.Task] = set()
+        # Chain id never changes at runtime; resolve the display name once.
+        self._network_name = (
+            "Mainnet" if self.settings.hashkey_chain_id == 133 else "Testnet"
+        )
+        self._cb_dispatch = {
+            prefix: getattr(self, name) for prefix, name in self._CB_ROUTES.items()
+        }
+        if self.agent_registry is not None and hasattr(self.agent_registry, "on_change"):
+            self.agent_registry.on_change(self.invalidate_agents_cache)
+
+    def invalidate_agents_cache(self) -> None:
+        """Drop the cached /agents reply (called on registry changes)."""
+        self._agents_cache = None
 
     def setup(self, application: Application) -> None:
         """Register all handlers with the application."""
@@ -68,64 +277,28 @@ class HashBotHandler:
             MessageHandler(filters.TEXT & ~filters.COMMAND, self.message_handler)
         )
 
+        # Release the pooled OpenClaw connections when the bot stops
+        application.post_shutdown = self._on_shutdown
+
+    async def _on_shutdown(self, application: Application) -> None:
+        """Close shared clients when the application shuts down."""
+        await self.openclaw_client.close()
+
     async def start_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /start command."""
-        welcome_text = (
-            "\U0001f916 **Welcome to HashBot!**\n"
-            "\n"
-            "Bot \u7528 Bot\uff0c\u81ea\u52a8\u4ed8\u8d39 \u2014 Agent Economy on HashKey Chain\n"
-            "\n"
-            "**What I can do:**\n"
-            "\u2022 `/agents` - Browse available AI agents\n"
-            "\u2022 `/wallet` - Manage your wallet\n"
-            "\u2022 `/balance` - Check your HKDC balance\n"
-            "\u2022 `/pay` - Make a payment\n"
-            "\n"
-            "**How it works:**\n"
-            "1. Choose an Agent to help you\n"
-            "2. Agent requests payment (x402)\n"
-            "3. Pay with HKDC stablecoin\n"
-            "4. Get your result!\n"
-            "\n"
-            "Start by exploring `/agents` \U0001f447"
-        )
         await update.message.reply_text(
-            welcome_text,
+            _START_TEXT,
             parse_mode="Markdown",
-            reply_markup=InlineKeyboards.main_menu(),
+            reply_markup=_START_KB,
         )
 
     async def help_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /help command."""
-        help_text = (
-            "\U0001f4d6 **HashBot Help**\n"
-            "\n"
-            "**Commands:**\n"
-            "\u2022 `/start` - Start the bot\n"
-            "\u2022 `/agents` - List available agents\n"
-            "\u2022 `/wallet` - Wallet management\n"
-            "\u2022 `/balance` - Check HKDC balance\n"
-            "\u2022 `/pay <address> <amount>` - Send HKDC\n"
-            "\n"
-            "**About x402 Payments:**\n"
-            "When you use a paid agent, it will request payment automatically.\n"
-            "You'll see the price before confirming.\n"
-            "\n"
-            "**About A2A Protocol:**\n"
-            "HashBot uses Google's A2A protocol for agent communication.\n"
-            "Your agents can be called by other agents too!\n"
-            "\n"
-            "**HashKey Chain:**\n"
-            "All payments are settled on HashKey Chain with HKDC stablecoin.\n"
-            "Low fees, fast confirmation, fully compliant.\n"
-            "\n"
-            "Need more help? Contact @hashbot_support"
-        )
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(_HELP_TEXT, parse_mode="Markdown")
 
     async def myagent_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -133,7 +306,7 @@ class HashBotHandler:
         """Handle /myagent command - create or manage user's own agent."""
         user_id = update.effective_user.id
 
-        async for db in get_db():
+        async with get_db() as db:
             # Check if user has an agent
             agents = await self.agent_crud.get_by_owner(db, user_id)
 
@@ -159,24 +332,7 @@ class HashBotHandler:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /explore command - explore agent marketplace."""
-        explore_text = (
-            "\U0001f50d **Explore Agent Marketplace**\n\n"
-            "Browse agents by category:\n\n"
-            "\U0001f4b9 **DeFi & Trading**\n"
-            "- Token swap agents\n"
-            "- Price analysis\n"
-            "- Portfolio management\n\n"
-            "\U0001f4dd **Content & Creative**\n"
-            "- Translation\n"
-            "- Writing assistance\n"
-            "- Image generation\n\n"
-            "\U0001f4bb **Development**\n"
-            "- Code review\n"
-            "- Smart contract audit\n"
-            "- Bug detection\n\n"
-            "Use /agents to see all available agents."
-        )
-        await update.message.reply_text(explore_text, parse_mode="Markdown")
+        await update.message.reply_text(_EXPLORE_TEXT, parse_mode="Markdown")
 
     async def skills_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -184,7 +340,7 @@ class HashBotHandler:
         """Handle /skills command - manage agent skills."""
         user_id = update.effective_user.id
 
-        async for db in get_db():
+        async with get_db() as db:
             agents = await self.agent_crud.get_by_owner(db, user_id)
 
             if not agents:
@@ -193,129 +349,90 @@ class HashBotHandler:
                 )
                 return
 
-            # List available skills
-            available_skills = list_skills()
-            skills_text = (
-                "\U0001f6e0 **Available Skills**\n\n"
-                "Install skills to enhance your agent:\n\n"
-            )
-
-            for skill in available_skills:
-                skills_text += (
-                    f"**{skill['name']}** (`{skill['slug']}`)\n"
-                    f"{skill['description']}\n\n"
-                )
-
-            skills_text += "Reply with skill slug to install (e.g., `hsk-crypto-price`)"
-
-        await update.message.reply_text(skills_text, parse_mode="Markdown")
+        await update.message.reply_text(_render_skills_text(), parse_mode="Markdown")
 
     async def agents_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /agents command."""
-        agents_text = "\U0001f916 **Available Agents**\n\nChoose an agent to interact with:\n"
-
-        # Get agents from registry if available
-        agents = []
-        if self.agent_registry:
-            agents = self.agent_registry.list_agents()
-
-        if not agents:
-            # Default demo agents
-            agents = [
-                {
-                    "id": "crypto_analyst",
-                    "name": "Crypto Analyst",
-                    "description": "Token analysis and market insights",
-                    "price": "0.1 HKDC",
-                },
-                {
-                    "id": "translator",
-                    "name": "AI Translator",
-                    "description": "Multi-language translation",
-                    "price": "0.05 HKDC",
-                },
-                {
-                    "id": "code_reviewer",
-                    "name": "Code Reviewer",
-                    "description": "Smart contract audit",
-                    "price": "0.5 HKDC",
-                },
-            ]
-
-        for agent in agents:
-            agents_text += (
-                f"\n**{agent['name']}** (`{agent['id']}`)\n"
-                f"{agent['description']}\n"
-                f"\U0001f4b0 {agent['price']} per call\n"
-            )
-
+        text, keyboard = await self._agents_screen()
         await update.message.reply_text(
-            agents_text,
+            text,
             parse_mode="Markdown",
-            reply_markup=InlineKeyboards.agent_list(agents),
+            reply_markup=keyboard,
         )
 
+    async def _agents_screen(self) -> tuple[str, Any]:
+        """Render (and cache) the agent-list text and keyboard.
+
+        Registry lookups go through the batched variant (one gather, one RTT
+        against a remote registry); without a registry the prerendered
+        fallback screen is served as-is.
+        """
+        if self._agents_cache is None:
+            agents = []
+            if self.agent_registry:
+                agents = await self.agent_registry.list_agents_batch()
+
+            if not agents:
+                self._agents_cache = (_DEFAULT_AGENTS_TEXT, _DEFAULT_AGENTS_KB)
+            else:
+                text = _AGENTS_HEADER + "".join(
+                    _format_agent_entry(agent) for agent in agents
+                )
+                self._agents_cache = (text, InlineKeyboards.agent_list(agents))
+
+        return self._agents_cache
+
     async def wallet_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
         """Handle /wallet command."""
         user_id = update.effective_user.id
+        wallet_text, keyboard = await self._wallet_screen(user_id)
+        await update.message.reply_text(
+            wallet_text,
+            parse_mode="Markdown",
+            reply_markup=keyboard,
+        )
 
-        # Get or create wallet for user
+    async def _wallet_screen(self, user_id: int) -> tuple[str, Any]:
+        """Render the /wallet text and keyboard for a user."""
         wallet_info = await self._get_user_wallet(user_id)
 
         if wallet_info:
-            network = "Mainnet" if self.settings.hashkey_chain_id == 133 else "Testnet"
-            wallet_text = (
-                "\U0001f4bc **Your Wallet**\n"
-                "\n"
-                f"**Address:** `{wallet_info['address']}`\n"
-                f"**Network:** HashKey Chain {network}\n"
-                "\n"
-                "Use `/balance` to check your HKDC balance."
+            wallet_text = _WALLET_TMPL.format(
+                address=wallet_info["address"], network=self._network_name
             )
         else:
-            wallet_text = (
-                "\U0001f4bc **Wallet Setup**\n"
-                "\n"
-                "You don't have a wallet yet.\n"
-                "Click below to create one or import existing."
-            )
+            wallet_text = _WALLET_SETUP_TEXT
 
-        await update.message.reply_text(
-            wallet_text,
-            parse_mode="Markdown",
-            reply_markup=InlineKeyboards.wallet_menu(has_wallet=bool(wallet_info)),
+        return wallet_text, InlineKeyboards.wallet_menu(has_wallet=bool(wallet_info))
+
+    async def _fetch_balances(self, address: str) -> tuple[Decimal, Decimal]:
+        """Fetch the HKDC and native balances for an address concurrently.
+
+        The two chain RPC calls are independent, so overlapping them halves
+        the wall-clock wait for every balance view.
+        """
+        if not self.wallet_service:
+            return _ZERO, _ZERO
+        hkdc_balance, native_balance = await asyncio.gather(
+            self.wallet_service.get_hkdc_balance(address),
+            self.wallet_service.get_native_balance(address),
         )
+        return hkdc_balance, native_balance
 
-    async def balance_command(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ) -> None:
-        """Handle /balance command."""
-        user_id = update.effective_user.id
+    async def _balance_screen(self, user_id: int) -> str | None:
+        """Render the balance text for a user, or None without a wallet."""
         wallet_info = await self._get_user_wallet(user_id)
-
         if not wallet_info:
-            await update.message.reply_text(
-                "\u274c No wallet found. Use /wallet to create one."
-            )
-            return
-
-        # Get balance (placeholder)
-        hkdc_balance = Decimal("0.00")
-        native_balance = Decimal("0.00")
-
-        if self.wallet_service:
-            hkdc_balance = await self.wallet_service.get_hkdc_balance(
-                wallet_info["address"]
-            )
-            native_balance = await self.wallet_service.get_native_balance(
-                wallet_info["address"]
-            )
+            return None
 
-        balance_text = (
+        hkdc_balance, native_balance = await self._fetch_balances(
+            wallet_info["address"]
+        )
+        return (
             "\U0001f4b0 **Your Balance**\n"
             "\n"
             f"**HKDC:** {hkdc_balance:.2f}\n"
@@ -324,6 +441,18 @@ class HashBotHandler:
             f"Address: `{wallet_info['address']}`"
         )
 
+    async def balance_command(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Handle /balance command."""
+        balance_text = await self._balance_screen(update.effective_user.id)
+
+        if balance_text is None:
+            await update.message.reply_text(
+                "\u274c No wallet found. Use /wallet to create one."
+            )
+            return
+
         await update.message.reply_text(balance_text, parse_mode="Markdown")
 
     async def pay_command(
@@ -343,18 +472,17 @@ class HashBotHandler:
         to_address = args[0]
 
         # Validate Ethereum address format
-        if not re.fullmatch(r"0x[0-9a-fA-F]{40}", to_address):
+        if not _ADDR_RE.fullmatch(to_address):
             await update.message.reply_text(
                 "\u274c Invalid address. Must be a valid Ethereum address "
                 "(0x followed by 40 hex characters)."
             )
             return
 
-        try:
-            amount = Decimal(args[1])
-        except Exception:
+        if not _AMOUNT_RE.fullmatch(args[1]):
             await update.message.reply_text("\u274c Invalid amount")
             return
+        amount = Decimal(args[1])
 
         # Confirm payment
         await update.message.reply_text(
@@ -372,18 +500,15 @@ class HashBotHandler:
         """Handle regular text messages."""
         text = update.message.text
 
-        # Check if user is in an agent session
-        session = context.user_data.get("agent_session")
+        # Check if user is in an agent session; the empty-dict check skips
+        # the .get call for users who never opened one.
+        session = context.user_data and context.user_data.get("agent_session")
 
         if session:
             # Forward to agent
             await self._handle_agent_message(update, context, session, text)
         else:
-            # Default response
-            await update.message.reply_text(
-                "Use /agents to start chatting with an AI agent, "
-                "or /help for more options."
-            )
+            await update.message.reply_text(_NO_SESSION_HINT)
 
     async def button_callback(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -392,69 +517,83 @@ class HashBotHandler:
         query = update.callback_query
         await query.answer()
 
-        data = query.data
+        # One dict hit on the prefix before ":" instead of a string-compare
+        # cascade; each callback parses its own tail.
+        prefix, _, rest = query.data.partition(":")
+        handler = self._cb_dispatch.get(prefix)
+        if handler:
+            await handler(query, context, rest)
 
-        if data.startswith("agent:"):
-            agent_id = data.split(":")[1]
-            await self._start_agent_session(query, context, agent_id)
+    async def _cb_agent(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, agent_id: str
+    ) -> None:
+        await self._start_agent_session(query, context, agent_id)
 
-        elif data.startswith("agent_new:"):
-            agent_id = data.split(":")[1]
-            await self._start_agent_session(query, context, agent_id)
+    async def _cb_agent_exit(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, rest: str
+    ) -> None:
+        context.user_data.pop("agent_session", None)
+        await query.edit_message_text(
+            "Session ended. Use /agents to start a new one.",
+            reply_markup=InlineKeyboards.main_menu(),
+        )
 
-        elif data == "agent_exit":
-            context.user_data.pop("agent_session", None)
+    async def _cb_menu(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, section: str
+    ) -> None:
+        if not section:
             await query.edit_message_text(
-                "Session ended. Use /agents to start a new one.",
+                "Choose an option:",
                 reply_markup=InlineKeyboards.main_menu(),
             )
+            return
+        await self._handle_menu_callback(query, context, section)
 
-        elif data.startswith("menu:"):
-            section = data.split(":")[1]
-            await self._handle_menu_callback(query, context, section)
-
-        elif data.startswith("pay_confirm:"):
-            parts = data.split(":")
-            to_address = parts[1]
-            amount = parts[2]
-            await self._execute_payment(query, context, to_address, amount)
-
-        elif data == "pay_cancel":
-            await query.edit_message_text("\u274c Payment cancelled.")
+    async def _cb_pay_confirm(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, rest: str
+    ) -> None:
+        to_address, _, amount = rest.partition(":")
+        await self._execute_payment(query, context, to_address, amount)
 
-        elif data.startswith("x402_pay:"):
-            task_id = data.split(":")[1]
-            await query.edit_message_text(
-                f"\u23f3 Processing x402 payment for task `{task_id}`...",
-                parse_mode="Markdown",
-            )
+    async def _cb_pay_cancel(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, rest: str
+    ) -> None:
+        await query.edit_message_text("\u274c Payment cancelled.")
 
-        elif data.startswith("x402_cancel:"):
-            task_id = data.split(":")[1]
-            await query.edit_message_text(
-                f"\u274c Payment for task `{task_id}` cancelled.",
-                parse_mode="Markdown",
-            )
+    async def _cb_x402_pay(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, task_id: str
+    ) -> None:
+        await query.edit_message_text(
+            f"\u23f3 Processing x402 payment for task `{task_id}`...",
+            parse_mode="Markdown",
+        )
 
-        elif data == "wallet_create":
-            await self._create_wallet(query, context)
+    async def _cb_x402_cancel(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, task_id: str
+    ) -> None:
+        await query.edit_message_text(
+            f"\u274c Payment for task `{task_id}` cancelled.",
+            parse_mode="Markdown",
+        )
 
-        elif data == "wallet_import":
-            await query.edit_message_text(
-                "Send your private key to import wallet.\n"
-                "\u26a0\ufe0f Make sure you're in a private chat!"
-            )
-            context.user_data["awaiting_private_key"] = True
+    async def _cb_wallet_create(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, rest: str
+    ) -> None:
+        await self._create_wallet(query, context)
 
-        elif data.startswith("wallet:"):
-            action = data.split(":")[1]
-            await self._handle_wallet_callback(query, context, action)
+    async def _cb_wallet_import(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, rest: str
+    ) -> None:
+        await query.edit_message_text(
+            "Send your private key to import wallet.\n"
+            "\u26a0\ufe0f Make sure you're in a private chat!"
+        )
+        context.user_data["awaiting_private_key"] = True
 
-        elif data == "menu":
-            await query.edit_message_text(
-                "Choose an option:",
-                reply_markup=InlineKeyboards.main_menu(),
-            )
+    async def _cb_wallet(
+        self, query: Any, context: ContextTypes.DEFAULT_TYPE, action: str
+    ) -> None:
+        await self._handle_wallet_callback(query, context, action)
 
     async def _handle_menu_callback(
         self,
@@ -464,119 +603,35 @@ class HashBotHandler:
     ) -> None:
         """Route main menu button presses."""
         if section == "agents":
-            agents = []
-            if self.agent_registry:
-                agents = self.agent_registry.list_agents()
-
-            if not agents:
-                agents = [
-                    {"id": "crypto_analyst", "name": "Crypto Analyst",
-                     "description": "Token analysis and market insights", "price": "0.1 HKDC"},
-                    {"id": "translator", "name": "AI Translator",
-                     "description": "Multi-language translation", "price": "0.05 HKDC"},
-                    {"id": "code_reviewer", "name": "Code Reviewer",
-                     "description": "Smart contract audit", "price": "0.5 HKDC"},
-                ]
-
-            text = "\U0001f916 **Available Agents**\n\nChoose an agent to interact with:\n"
-            for agent in agents:
-                text += (
-                    f"\n**{agent['name']}** (`{agent['id']}`)\n"
-                    f"{agent['description']}\n"
-                    f"\U0001f4b0 {agent['price']} per call\n"
-                )
+            text, keyboard = await self._agents_screen()
             await query.edit_message_text(
                 text,
                 parse_mode="Markdown",
-                reply_markup=InlineKeyboards.agent_list(agents),
+                reply_markup=keyboard,
             )
 
         elif section == "wallet":
-            user_id = query.from_user.id
-            wallet_info = await self._get_user_wallet(user_id)
-
-            if wallet_info:
-                network = "Mainnet" if self.settings.hashkey_chain_id == 133 else "Testnet"
-                wallet_text = (
-                    "\U0001f4bc **Your Wallet**\n"
-                    "\n"
-                    f"**Address:** `{wallet_info['address']}`\n"
-                    f"**Network:** HashKey Chain {network}\n"
-                    "\n"
-                    "Use `/balance` to check your HKDC balance."
-                )
-            else:
-                wallet_text = (
-                    "\U0001f4bc **Wallet Setup**\n"
-                    "\n"
-                    "You don't have a wallet yet.\n"
-                    "Click below to create one or import existing."
-                )
-
+            wallet_text, keyboard = await self._wallet_screen(query.from_user.id)
             await query.edit_message_text(
                 wallet_text,
                 parse_mode="Markdown",
-                reply_markup=InlineKeyboards.wallet_menu(has_wallet=bool(wallet_info)),
+                reply_markup=keyboard,
             )
 
         elif section == "balance":
-            user_id = query.from_user.id
-            wallet_info = await self._get_user_wallet(user_id)
+            balance_text = await self._balance_screen(query.from_user.id)
 
-            if not wallet_info:
+            if balance_text is None:
                 await query.edit_message_text(
                     "\u274c No wallet found. Use /wallet to create one.",
                     reply_markup=InlineKeyboards.main_menu(),
                 )
                 return
 
-            hkdc_balance = Decimal("0.00")
-            native_balance = Decimal("0.00")
-
-            if self.wallet_service:
-                hkdc_balance = await self.wallet_service.get_hkdc_balance(
-                    wallet_info["address"]
-                )
-                native_balance = await self.wallet_service.get_native_balance(
-                    wallet_info["address"]
-                )
-
-            balance_text = (
-                "\U0001f4b0 **Your Balance**\n"
-                "\n"
-                f"**HKDC:** {hkdc_balance:.2f}\n"
-                f"**HSK:** {native_balance:.6f}\n"
-                "\n"
-                f"Address: `{wallet_info['address']}`"
-            )
             await query.edit_message_text(balance_text, parse_mode="Markdown")
 
         elif section == "help":
-            help_text = (
-                "\U0001f4d6 **HashBot Help**\n"
-                "\n"
-                "**Commands:**\n"
-                "\u2022 `/start` - Start the bot\n"
-                "\u2022 `/agents` - List available agents\n"
-                "\u2022 `/wallet` - Wallet management\n"
-                "\u2022 `/balance` - Check HKDC balance\n"
-                "\u2022 `/pay <address> <amount>` - Send HKDC\n"
-                "\n"
-                "**About x402 Payments:**\n"
-                "When you use a paid agent, it will request payment automatically.\n"
-                "You'll see the price before confirming.\n"
-                "\n"
-                "**About A2A Protocol:**\n"
-                "HashBot uses Google's A2A protocol for agent communication.\n"
-                "Your agents can be called by other agents too!\n"
-                "\n"
-                "**HashKey Chain:**\n"
-                "All payments are settled on HashKey Chain with HKDC stablecoin.\n"
-                "Low fees, fast confirmation, fully compliant.\n"
-                "\n"
-                "Need more help? Contact @hashbot_support"
-            )
-            await query.edit_message_text(help_text, parse_mode="Markdown")
+            await query.edit_message_text(_HELP_TEXT, parse_mode="Markdown")
 
     async def _handle_wallet_callback(
         self,
@@ -596,16 +651,9 @@ class HashBotHandler:
             return
 
         if action == "balance":
-            hkdc_balance = Decimal("0.00")
-            native_balance = Decimal("0.00")
-
-            if self.wallet_service:
-                hkdc_balance = await self.wallet_service.get_hkdc_balance(
-                    wallet_info["address"]
-                )
-                native_balance = await self.wallet_service.get_native_balance(
-                    wallet_info["address"]
-                )
+            hkdc_balance, native_balance = await self._fetch_balances(
+                wallet_info["address"]
+            )
 
             await query.edit_message_text(
                 f"\U0001f4b0 **HKDC:** {hkdc_balance:.2f}\n"
@@ -628,15 +676,31 @@ class HashBotHandler:
             )
 
     async def _get_user_wallet(self, user_id: int) -> dict[str, Any] | None:
-        """Get wallet for user."""
-        async for db in get_db():
-            user = await self.user_crud.get_by_telegram_id(db, user_id)
-            if user and user.wallet_address:
-                return {
-                    "address": user.wallet_address,
-                    "encrypted_key": user.encrypted_private_key,
-                }
-            return None
+        """Get wallet for user (cached for a short TTL)."""
+        cached = self._wallet_cache.get(user_id)
+        if cached and (time.monotonic() - cached[0]) < self._wallet_cache_ttl:
+            return cached[1]
+
+        async with self._wallet_locks[user_id]:
+            # Re-check: another waiter may have filled the cache meanwhile.
+            cached = self._wallet_cache.get(user_id)
+            if cached and (time.monotonic() - cached[0]) < self._wallet_cache_ttl:
+                return cached[1]
+
+            async with get_db() as db:
+                user = await self.user_crud.get_by_telegram_id(db, user_id)
+                if user and user.wallet_address:
+                    wallet_info = {
+                        "address": user.wallet_address,
+                        "encrypted_key": user.encrypted_private_key,
+                    }
+                    self._wallet_cache[user_id] = (time.monotonic(), wallet_info)
+                    return wallet_info
+                return None
+
+    def _invalidate_wallet_cache(self, user_id: int) -> None:
+        """Drop a user's cached wallet (called after create/import)."""
+        self._wallet_cache.pop(user_id, None)
 
     async def _handle_agent_message(
         self,
@@ -646,7 +710,13 @@ class HashBotHandler:
         text: str,
     ) -> None:
         """Handle message in agent session."""
-        await update.message.chat.send_action(ChatAction.TYPING)
+        # Purely cosmetic, so don't block the agent round-trip on it; the
+        # set keeps a strong reference until the task completes.
+        typing_task = asyncio.create_task(
+            update.message.chat.send_action(ChatAction.TYPING)
+        )
+        self._background_tasks.add(typing_task)
+        typing_task.add_done_callback(self._background_tasks.discard)
 
         try:
             # Get agent details
@@ -656,12 +726,13 @@ class HashBotHandler:
             # Create session key for OpenClaw
             session_key = f"tg_{user_id}_{agent_id}"
 
-            # Send message to agent via OpenClaw
-            response = await self.openclaw_client.send_message(
-                agent_id=agent_id,
-                session_key=session_key,
-                text=text,
-            )
+            # Send message to agent via OpenClaw, bounded by the semaphore
+            async with self._openclaw_sem:
+                response = await self.openclaw_client.send_message(
+                    agent_id=agent_id,
+                    session_key=session_key,
+                    text=text,
+                )
 
             if response:
                 await update.message.reply_text(
@@ -688,7 +759,10 @@ class HashBotHandler:
         agent_id: str,
     ) -> None:
         """Start a new agent session."""
-        agent_name = agent_id.replace("_", " ").title()
+        if self.agent_registry is not None:
+            agent_name = self.agent_registry.display_name(agent_id)
+        else:
+            agent_name = _pretty_agent_name(agent_id)
         context.user_data["agent_session"] = {
             "agent_id": agent_id,
             "agent_name": agent_name,
@@ -757,24 +831,17 @@ class HashBotHandler:
             # Create wallet via wallet service
             wallet_data = await self.wallet_service.create_wallet(user_id)
 
-            # Save to database
-            async for db in get_db():
-                user = await self.user_crud.get_by_telegram_id(db, user_id)
-                if not user:
-                    user = await self.user_crud.create(
-                        db,
-                        telegram_id=user_id,
-                        username=username,
-                        wallet_address=wallet_data["address"],
-                        encrypted_private_key=wallet_data["encrypted_key"],
-                    )
-                else:
-                    await self.user_crud.update(
-                        db,
-                        user.id,
-                        wallet_address=wallet_data["address"],
-                        encrypted_private_key=wallet_data["encrypted_key"],
-                    )
+            # Save to database in one upsert round trip
+            async with get_db() as db:
+                await self.user_crud.upsert_wallet(
+                    db,
+                    telegram_id=user_id,
+                    username=username,
+                    wallet_address=wallet_data["address"],
+                    encrypted_private_key=wallet_data["encrypted_key"],
+                )
+
+            self._invalidate_wallet_cache(user_id)
 
             await query.edit_message_text(
                 "\u2705 Wallet created!\n\n"
@@ -1,17 +1,21 @@
 """Telegram inline keyboard builders."""
 
+import functools
 from typing import Any
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+_BACK_BUTTON = InlineKeyboardButton("◀️ Back", callback_data="menu")
+_PAY_CANCEL_BUTTON = InlineKeyboardButton("❌ Cancel", callback_data="pay_cancel")
+
 
 class InlineKeyboards:
     """Factory for inline keyboards."""
 
-    @staticmethod
-    def main_menu() -> InlineKeyboardMarkup:
-        """Main menu keyboard."""
-        keyboard = [
+    # Content-free keyboards built once at import; markup objects are
+    # immutable and serialized per send, so sharing across replies is safe.
+    _MAIN = InlineKeyboardMarkup(
+        [
             [
                 InlineKeyboardButton("🤖 Agents", callback_data="menu:agents"),
                 InlineKeyboardButton("💼 Wallet", callback_data="menu:wallet"),
@@ -21,62 +25,58 @@ class InlineKeyboards:
                 InlineKeyboardButton("❓ Help", callback_data="menu:help"),
             ],
         ]
-        return InlineKeyboardMarkup(keyboard)
+    )
+    _WALLET_YES = InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton("💰 Balance", callback_data="wallet:balance"),
+                InlineKeyboardButton("📤 Send", callback_data="wallet:send"),
+            ],
+            [
+                InlineKeyboardButton("📋 Address", callback_data="wallet:address"),
+                InlineKeyboardButton("🔑 Export", callback_data="wallet:export"),
+            ],
+            [InlineKeyboardButton("◀️ Back", callback_data="menu")],
+        ]
+    )
+    _WALLET_NO = InlineKeyboardMarkup(
+        [
+            [InlineKeyboardButton("➕ Create Wallet", callback_data="wallet_create")],
+            [InlineKeyboardButton("📥 Import Wallet", callback_data="wallet_import")],
+            [InlineKeyboardButton("◀️ Back", callback_data="menu")],
+        ]
+    )
+
+    @staticmethod
+    def main_menu() -> InlineKeyboardMarkup:
+        """Main menu keyboard."""
+        return InlineKeyboards._MAIN
 
     @staticmethod
     def agent_list(agents: list[dict[str, Any]]) -> InlineKeyboardMarkup:
         """Agent selection keyboard."""
-        keyboard = []
-
-        for agent in agents:
-            keyboard.append(
-                [
-                    InlineKeyboardButton(
-                        f"🤖 {agent['name']} ({agent['price']})",
-                        callback_data=f"agent:{agent['id']}",
-                    )
-                ]
-            )
-
-        keyboard.append(
-            [InlineKeyboardButton("◀️ Back", callback_data="menu")]
-        )
-
-        return InlineKeyboardMarkup(keyboard)
+        rows = [
+            [
+                InlineKeyboardButton(
+                    f"🤖 {agent['name']} ({agent['price']})",
+                    callback_data=f"agent:{agent['id']}",
+                )
+            ]
+            for agent in agents
+        ]
+        rows.append([_BACK_BUTTON])
+        return InlineKeyboardMarkup(rows)
 
     @staticmethod
     def wallet_menu(has_wallet: bool = False) -> InlineKeyboardMarkup:
         """Wallet management keyboard."""
-        if has_wallet:
-            keyboard = [
-                [
-                    InlineKeyboardButton("💰 Balance", callback_data="wallet:balance"),
-                    InlineKeyboardButton("📤 Send", callback_data="wallet:send"),
-                ],
-                [
-                    InlineKeyboardButton("📋 Address", callback_data="wallet:address"),
-                    InlineKeyboardButton("🔑 Export", callback_data="wallet:export"),
-                ],
-                [InlineKeyboardButton("◀️ Back", callback_data="menu")],
-            ]
-        else:
-            keyboard = [
-                [
-                    InlineKeyboardButton(
-                        "➕ Create Wallet", callback_data="wallet_create"
-                    ),
-                ],
-                [
-                    InlineKeyboardButton(
-                        "📥 Import Wallet", callback_data="wallet_import"
-                    ),
-                ],
-                [InlineKeyboardButton("◀️ Back", callback_data="menu")],
-            ]
-
-        return InlineKeyboardMarkup(keyboard)
+        return InlineKeyboards._WALLET_YES if has_wallet else InlineKeyboards._WALLET_NO
 
+    # Payment keyboards are keyed by ephemeral values (task ids,
+    # addresses), so the caches are bounded to act as a recent-pending
+    # buffer rather than growing without limit.
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def confirm_payment(to_address: str, amount: str) -> InlineKeyboardMarkup:
         """Payment confirmation keyboard."""
         keyboard = [
@@ -85,12 +85,13 @@ class InlineKeyboards:
                     "✅ Confirm",
                     callback_data=f"pay_confirm:{to_address}:{amount}",
                 ),
-                InlineKeyboardButton("❌ Cancel", callback_data="pay_cancel"),
+                _PAY_CANCEL_BUTTON,
             ],
         ]
         return InlineKeyboardMarkup(keyboard)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def payment_required(
         agent_name: str,
         price: str,
@@ -113,9 +114,12 @@ class InlineKeyboards:
         ]
         return InlineKeyboardMarkup(keyboard)
 
+    # Unbounded cache (no LRU bookkeeping per hit); the keyspace is
+    # bounded by the agent catalog.
     @staticmethod
+    @functools.cache
     def agent_session(agent_id: str) -> InlineKeyboardMarkup:
-        """Agent session keyboard."""
+        """Agent session keyboard (memoized per agent id)."""
         keyboard = [
             [
                 InlineKeyboardButton(
@@ -131,8 +135,9 @@ class InlineKeyboards:
         return InlineKeyboardMarkup(keyboard)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def back_button(callback_data: str = "menu") -> InlineKeyboardMarkup:
-        """Simple back button."""
+        """Simple back button (memoized per target)."""
         return InlineKeyboardMarkup(
             [[InlineKeyboardButton("◀️ Back", callback_data=callback_data)]]
         )
@@ -1,14 +1,31 @@
 """HashBot configuration management."""
 
-from functools import lru_cache
-from typing import Literal
+from enum import StrEnum
+from functools import cache
+from typing import Annotated
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+class LogLevel(StrEnum):
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+
+
+class LogFormat(StrEnum):
+    JSON = "json"
+    CONSOLE = "console"
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+
+    Parsed eagerly, exactly once per process (see ``get_settings``), so
+    every config error surfaces at startup rather than mid-request.
+    """
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -46,11 +63,16 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(default="sqlite+aiosqlite:///./hashbot.db")
+    db_pool_size: int = Field(default=20)
+    db_max_overflow: int = Field(default=40)
+    db_pool_recycle: int = Field(default=1800)
+    db_statement_cache_size: int = Field(default=1200)
 
     # OpenClaw Gateway
     openclaw_gateway_url: str = Field(default="http://localhost:18789")
     openclaw_gateway_token: str = Field(default="")
     openclaw_workspaces_dir: str = Field(default="~/.hashbot/workspaces")
+    openclaw_max_concurrency: int = Field(default=32)
 
     # Agent defaults
     default_agent_model: str = Field(default="claude-sonnet-4-20250514")
@@ -68,14 +90,24 @@ class Settings(BaseSettings):
     jwt_secret: str = Field(default="")
     jwt_algorithm: str = Field(default="HS256")
     jwt_expire_minutes: int = Field(default=60)
-    cors_origins: list[str] = Field(default=["*"])
+    # NoDecode: CORS_ORIGINS is a plain comma-separated list (e.g.
+    # "https://a.example,https://b.example"), not JSON.
+    cors_origins: Annotated[list[str], NoDecode] = Field(default=["*"])
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_cors_origins(cls, value: object) -> object:
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
 
     # Logging
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(default="INFO")
-    log_format: Literal["json", "console"] = Field(default="json")
+    log_level: LogLevel = Field(default=LogLevel.INFO)
+    log_format: LogFormat = Field(default=LogFormat.JSON)
 
 
-@lru_cache
+# cache rather than lru_cache: a single value needs no LRU bookkeeping.
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -7,6 +7,7 @@ from hashbot.db.crud import (  # noqa: F401 – re-exported convenience helpers
     get_or_create_user,
     # Agent helpers
     get_agent_by_id,
+    get_agent_with_skills,
     get_public_agents,
     get_user_agents,
     create_agent,
@@ -35,6 +36,7 @@ __all__ = [
     "get_or_create_user",
     # Agent helpers
     "get_agent_by_id",
+    "get_agent_with_skills",
     "get_public_agents",
     "get_user_agents",
     "create_agent",
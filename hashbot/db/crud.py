@@ -1,23 +1,76 @@
-"""CRUD operations for HashBot database."""
-
+"""CRUD operations for HashBot database.
+
+Single source of truth for query logic: the *CRUD classes own the
+statements, and the module-level helpers below delegate to shared
+singleton instances — so each distinct query compiles (and occupies the
+SQLAlchemy statement cache) exactly once, regardless of entry point.
+"""
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import Any
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from hashbot.db.models import User, Agent, AgentSkill, Payment, Wallet
 
+# Hot-path Select objects built once at import; only parameter binding
+# remains per call.
+_SEL_USER_BY_TG = select(User).where(User.telegram_id == bindparam("tg")).limit(1)
+# Listings eager-load skills in one batched IN query (selectinload, not
+# joinedload — one-to-many would row-explode a join) so sessions can
+# close without leaving lazy loads behind. raiseload("*") turns any
+# relationship access we forgot to eager-load into an immediate error
+# instead of a silent N+1 or MissingGreenlet in production.
+_SEL_AGENT_WITH_SKILLS = (
+    select(Agent)
+    .where(Agent.id == bindparam("agent_id"))
+    .options(selectinload(Agent.skills), raiseload("*"))
+    .limit(1)
+)
+_SEL_AGENTS_BY_OWNER = (
+    select(Agent)
+    .where(Agent.owner_id == bindparam("owner_id"))
+    .options(selectinload(Agent.skills), raiseload("*"))
+)
+_SEL_PUBLIC_AGENTS = (
+    select(Agent)
+    .where(Agent.is_public == True)
+    .options(selectinload(Agent.skills), raiseload("*"))
+)
+_SEL_WALLET_BY_USER = select(Wallet).where(Wallet.user_id == bindparam("user_id")).limit(1)
+_SEL_WALLET_BY_TG = select(Wallet).where(Wallet.telegram_id == bindparam("tg")).limit(1)
+_SEL_WALLET_JOIN_USER = (
+    select(Wallet)
+    .join(User, Wallet.user_id == User.id)
+    .where(User.telegram_id == bindparam("tg"))
+    .limit(1)
+)
+_SEL_SKILLS_BY_AGENT = (
+    select(AgentSkill)
+    .where(AgentSkill.agent_id == bindparam("agent_id"))
+    .options(raiseload("*"))
+)
+
 
 class UserCRUD:
     """CRUD operations for User model."""
 
     async def get_by_id(self, db: AsyncSession, user_id: int) -> User | None:
-        """Get user by ID."""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        """Get user by ID.
+
+        session.get hits the identity map first, so repeat lookups
+        within a shared session skip the database entirely.
+        """
+        return await db.get(User, user_id)
 
     async def get_by_telegram_id(self, db: AsyncSession, telegram_id: int) -> User | None:
         """Get user by Telegram ID."""
-        result = await db.execute(select(User).where(User.telegram_id == telegram_id))
+        result = await db.execute(_SEL_USER_BY_TG, {"tg": telegram_id})
         return result.scalar_one_or_none()
 
     async def create(
@@ -38,8 +91,9 @@ class UserCRUD:
             encrypted_private_key=encrypted_private_key,
         )
         db.add(user)
+        # No refresh: the flush's INSERT ... RETURNING already loads the
+        # server-generated id and created_at (same for the creates below).
         await db.commit()
-        await db.refresh(user)
         return user
 
     async def update(
@@ -49,16 +103,14 @@ class UserCRUD:
         **kwargs: Any,
     ) -> User | None:
         """Update user fields."""
-        user = await self.get_by_id(db, user_id)
-        if not user:
-            return None
-
-        for key, value in kwargs.items():
-            if hasattr(user, key):
-                setattr(user, key, value)
+        values = {k: v for k, v in kwargs.items() if k in User.__mapper__.columns}
+        if not values:
+            return await self.get_by_id(db, user_id)
 
+        # One UPDATE ... RETURNING round trip instead of SELECT + UPDATE.
+        stmt = update(User).where(User.id == user_id).values(**values).returning(User)
+        user = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(user)
         return user
 
     async def get_or_create(
@@ -68,30 +120,79 @@ class UserCRUD:
         username: str | None = None,
         display_name: str = "",
     ) -> User:
-        """Get existing user or create new one."""
-        user = await self.get_by_telegram_id(db, telegram_id)
-        if not user:
-            user = await self.create(db, telegram_id, username, display_name)
-        return user
+        """Get existing user or create new one.
+
+        INSERT ... ON CONFLICT DO NOTHING keeps get-only semantics (an
+        existing row is never modified) without the SELECT-then-INSERT
+        race; only the losing-the-race path pays a second query.
+        """
+        stmt = (
+            sqlite_insert(User)
+            .values(
+                telegram_id=telegram_id,
+                telegram_username=username,
+                display_name=display_name or username or f"User {telegram_id}",
+            )
+            .on_conflict_do_nothing(index_elements=[User.telegram_id])
+            .returning(User)
+        )
+        user = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        if user is not None:
+            return user
+        # Conflict: the user already exists — return the stored row.
+        return await self.get_by_telegram_id(db, telegram_id)
+
+    async def upsert_wallet(
+        self,
+        db: AsyncSession,
+        telegram_id: int,
+        username: str | None,
+        wallet_address: str,
+        encrypted_private_key: str,
+    ) -> None:
+        """Attach a wallet to a user, inserting the user if needed.
+
+        One INSERT ... ON CONFLICT DO UPDATE round trip instead of the
+        get + create/update triad.
+        """
+        stmt = (
+            sqlite_insert(User)
+            .values(
+                telegram_id=telegram_id,
+                telegram_username=username,
+                display_name=username or f"User {telegram_id}",
+                wallet_address=wallet_address,
+                encrypted_private_key=encrypted_private_key,
+            )
+            .on_conflict_do_update(
+                index_elements=[User.telegram_id],
+                set_={
+                    "wallet_address": wallet_address,
+                    "encrypted_private_key": encrypted_private_key,
+                },
+            )
+        )
+        await db.execute(stmt)
+        await db.commit()
 
 
 class AgentCRUD:
     """CRUD operations for Agent model."""
 
     async def get_by_id(self, db: AsyncSession, agent_id: str) -> Agent | None:
-        """Get agent by ID."""
-        result = await db.execute(select(Agent).where(Agent.id == agent_id))
-        return result.scalar_one_or_none()
+        """Get agent by ID (identity-map aware, see UserCRUD.get_by_id)."""
+        return await db.get(Agent, agent_id)
 
     async def get_by_owner(self, db: AsyncSession, owner_id: int) -> list[Agent]:
         """Get all agents owned by a user."""
-        result = await db.execute(select(Agent).where(Agent.owner_id == owner_id))
-        return list(result.scalars().all())
+        result = await db.scalars(_SEL_AGENTS_BY_OWNER, {"owner_id": owner_id})
+        return list(result)
 
     async def get_public_agents(self, db: AsyncSession) -> list[Agent]:
         """Get all public agents."""
-        result = await db.execute(select(Agent).where(Agent.is_public == True))
-        return list(result.scalars().all())
+        result = await db.scalars(_SEL_PUBLIC_AGENTS)
+        return list(result)
 
     async def create(
         self,
@@ -116,7 +217,6 @@ class AgentCRUD:
         )
         db.add(agent)
         await db.commit()
-        await db.refresh(agent)
         return agent
 
     async def update(
@@ -126,27 +226,28 @@ class AgentCRUD:
         **kwargs: Any,
     ) -> Agent | None:
         """Update agent fields."""
-        agent = await self.get_by_id(db, agent_id)
-        if not agent:
-            return None
-
-        for key, value in kwargs.items():
-            if hasattr(agent, key):
-                setattr(agent, key, value)
+        values = {k: v for k, v in kwargs.items() if k in Agent.__mapper__.columns}
+        if not values:
+            return await self.get_by_id(db, agent_id)
 
+        stmt = (
+            update(Agent).where(Agent.id == agent_id).values(**values).returning(Agent)
+        )
+        agent = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(agent)
         return agent
 
     async def delete(self, db: AsyncSession, agent_id: str) -> bool:
-        """Delete an agent."""
-        agent = await self.get_by_id(db, agent_id)
-        if not agent:
-            return False
-
-        await db.delete(agent)
+        """Delete an agent (and its skills)."""
+        # Skills first: the ORM-level cascade doesn't apply to Core
+        # deletes, and SQLite doesn't enforce the FK for us.
+        await db.execute(delete(AgentSkill).where(AgentSkill.agent_id == agent_id))
+        result = await db.execute(
+            delete(Agent).where(Agent.id == agent_id).returning(Agent.id)
+        )
+        deleted = result.scalar_one_or_none()
         await db.commit()
-        return True
+        return deleted is not None
 
 
 class TaskCRUD:
@@ -159,18 +260,25 @@ class TaskCRUD:
         agent_id: str,
         amount: float,
         currency: str = "HKDC",
+        tx_hash: str | None = None,
+        status: str = "pending",
     ) -> Payment:
-        """Create a new payment record."""
+        """Create a new payment record.
+
+        Callers that already know the settlement tx_hash pass it (with
+        status="completed") so the record lands in one INSERT instead of
+        an INSERT followed by an UPDATE, each with its own commit.
+        """
         payment = Payment(
             payer_user_id=payer_user_id,
             agent_id=agent_id,
             amount=amount,
             currency=currency,
-            status="pending",
+            tx_hash=tx_hash,
+            status=status,
         )
         db.add(payment)
         await db.commit()
-        await db.refresh(payment)
         return payment
 
     async def update_payment(
@@ -181,18 +289,23 @@ class TaskCRUD:
         status: str | None = None,
     ) -> Payment | None:
         """Update payment status."""
-        result = await db.execute(select(Payment).where(Payment.id == payment_id))
-        payment = result.scalar_one_or_none()
-        if not payment:
-            return None
-
+        values: dict[str, Any] = {}
         if tx_hash:
-            payment.tx_hash = tx_hash
+            values["tx_hash"] = tx_hash
         if status:
-            payment.status = status
-
+            values["status"] = status
+        if not values:
+            result = await db.execute(select(Payment).where(Payment.id == payment_id))
+            return result.scalar_one_or_none()
+
+        stmt = (
+            update(Payment)
+            .where(Payment.id == payment_id)
+            .values(**values)
+            .returning(Payment)
+        )
+        payment = (await db.execute(stmt)).scalar_one_or_none()
         await db.commit()
-        await db.refresh(payment)
         return payment
 
     async def get_user_payments(
@@ -200,15 +313,27 @@ class TaskCRUD:
         db: AsyncSession,
         user_id: int,
         limit: int = 50,
+        before: tuple[datetime, int] | None = None,
     ) -> list[Payment]:
-        """Get user's payment history."""
-        result = await db.execute(
+        """Get user's payment history, newest first.
+
+        Pass the last row's ``(created_at, id)`` as ``before`` for the
+        next page: keyset pagination stays an index range scan however
+        deep the history gets, where OFFSET would re-walk every skipped
+        row. The id tiebreaker matters because created_at comes from
+        SQLite's one-second NOW(), so page boundaries can land inside a
+        run of rows sharing a timestamp.
+        """
+        stmt = (
             select(Payment)
             .where(Payment.payer_user_id == user_id)
-            .order_by(Payment.created_at.desc())
+            .order_by(Payment.created_at.desc(), Payment.id.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        if before is not None:
+            stmt = stmt.where(tuple_(Payment.created_at, Payment.id) < before)
+        result = await db.scalars(stmt)
+        return list(result)
 
 
 class WalletCRUD:
@@ -216,7 +341,12 @@ class WalletCRUD:
 
     async def get_by_user_id(self, db: AsyncSession, user_id: int) -> Wallet | None:
         """Get wallet by user ID."""
-        result = await db.execute(select(Wallet).where(Wallet.user_id == user_id))
+        result = await db.execute(_SEL_WALLET_BY_USER, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    async def get_by_telegram_id(self, db: AsyncSession, telegram_id: int) -> Wallet | None:
+        """Get wallet by the owner's Telegram ID (join-free)."""
+        result = await db.execute(_SEL_WALLET_BY_TG, {"tg": telegram_id})
         return result.scalar_one_or_none()
 
     async def create(
@@ -225,18 +355,51 @@ class WalletCRUD:
         user_id: int,
         address: str,
         encrypted_private_key: str,
+        telegram_id: int | None = None,
     ) -> Wallet:
         """Create a new wallet."""
         wallet = Wallet(
             user_id=user_id,
+            telegram_id=telegram_id,
             address=address,
             encrypted_private_key=encrypted_private_key,
         )
         db.add(wallet)
         await db.commit()
-        await db.refresh(wallet)
         return wallet
 
+    async def get_or_create(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        address: str,
+        encrypted_private_key: str,
+        telegram_id: int | None = None,
+    ) -> Wallet:
+        """Get existing wallet or create new one.
+
+        INSERT ... ON CONFLICT DO NOTHING keeps first-write-wins
+        semantics (an existing wallet is never overwritten) without the
+        SELECT-then-INSERT race.
+        """
+        stmt = (
+            sqlite_insert(Wallet)
+            .values(
+                user_id=user_id,
+                telegram_id=telegram_id,
+                address=address,
+                encrypted_private_key=encrypted_private_key,
+            )
+            .on_conflict_do_nothing(index_elements=[Wallet.user_id])
+            .returning(Wallet)
+        )
+        wallet = (await db.execute(stmt)).scalar_one_or_none()
+        await db.commit()
+        if wallet is not None:
+            return wallet
+        # Conflict: another writer got there first — return their row.
+        return await self.get_by_user_id(db, user_id)
+
 
 class AgentSkillCRUD:
     """CRUD operations for AgentSkill model."""
@@ -257,7 +420,6 @@ class AgentSkillCRUD:
         )
         db.add(skill)
         await db.commit()
-        await db.refresh(skill)
         return skill
 
     async def get_agent_skills(
@@ -266,10 +428,8 @@ class AgentSkillCRUD:
         agent_id: str,
     ) -> list[AgentSkill]:
         """Get all skills for an agent."""
-        result = await db.execute(
-            select(AgentSkill).where(AgentSkill.agent_id == agent_id)
-        )
-        return list(result.scalars().all())
+        result = await db.scalars(_SEL_SKILLS_BY_AGENT, {"agent_id": agent_id})
+        return list(result)
 
     async def remove_skill(
         self,
@@ -279,21 +439,19 @@ class AgentSkillCRUD:
     ) -> bool:
         """Remove a skill from an agent."""
         result = await db.execute(
-            select(AgentSkill)
+            delete(AgentSkill)
             .where(AgentSkill.agent_id == agent_id)
             .where(AgentSkill.skill_slug == skill_slug)
+            .returning(AgentSkill.id)
         )
-        skill = result.scalar_one_or_none()
-        if not skill:
-            return False
-
-        await db.delete(skill)
+        deleted = result.first()
         await db.commit()
-        return True
+        return deleted is not None
 
 
 # ── Module-level convenience functions ────────────────────────────────
-# These auto-manage DB sessions so callers don't need to.
+# These auto-manage DB sessions so callers don't need to; pass an
+# existing session to share one transaction across several calls.
 
 _user_crud = UserCRUD()
 _agent_crud = AgentCRUD()
@@ -308,10 +466,26 @@ def _get_session() -> AsyncSession:
     return get_db()
 
 
+@asynccontextmanager
+async def _with_session(session: AsyncSession | None) -> AsyncIterator[AsyncSession]:
+    """Yield the caller's session, or open (and close) a fresh one.
+
+    Passing one session through several helpers means one pool checkout
+    and one transaction per workflow instead of one per call.
+    """
+    if session is not None:
+        yield session
+    else:
+        async with _get_session() as db:
+            yield db
+
+
 # ── User helpers ──────────────────────────────────────────────────────
 
-async def get_user_by_telegram_id(telegram_id: int) -> User | None:
-    async with _get_session() as db:
+async def get_user_by_telegram_id(
+    telegram_id: int, session: AsyncSession | None = None
+) -> User | None:
+    async with _with_session(session) as db:
         return await _user_crud.get_by_telegram_id(db, telegram_id)
 
 
@@ -319,25 +493,60 @@ async def get_or_create_user(
     telegram_id: int,
     username: str | None = None,
     display_name: str = "",
+    session: AsyncSession | None = None,
 ) -> User:
-    async with _get_session() as db:
+    async with _with_session(session) as db:
         return await _user_crud.get_or_create(db, telegram_id, username, display_name)
 
 
 # ── Agent helpers ─────────────────────────────────────────────────────
 
-async def get_agent_by_id(agent_id: str) -> Agent | None:
-    async with _get_session() as db:
+async def get_agent_by_id(
+    agent_id: str, session: AsyncSession | None = None
+) -> Agent | None:
+    async with _with_session(session) as db:
         return await _agent_crud.get_by_id(db, agent_id)
 
 
-async def get_public_agents() -> list[Agent]:
-    async with _get_session() as db:
-        return await _agent_crud.get_public_agents(db)
+# Marketplace listing is read-mostly; a short TTL absorbs browse bursts.
+_PUBLIC_AGENTS_TTL = 5.0
+_public_agents_cache: tuple[float, list[Agent]] | None = None
+
+
+def _invalidate_public_agents_cache() -> None:
+    global _public_agents_cache
+    _public_agents_cache = None
+
+
+async def get_agent_with_skills(
+    agent_id: str, session: AsyncSession | None = None
+) -> Agent | None:
+    """Fetch an agent with its skills eagerly loaded.
+
+    Two batched queries instead of the agent lookup plus one query per
+    skill access — use this when both are needed.
+    """
+    async with _with_session(session) as db:
+        result = await db.execute(_SEL_AGENT_WITH_SKILLS, {"agent_id": agent_id})
+        return result.scalar_one_or_none()
+
+
+async def get_public_agents(session: AsyncSession | None = None) -> list[Agent]:
+    global _public_agents_cache
+    cached = _public_agents_cache
+    now = time.monotonic()
+    if cached and now - cached[0] < _PUBLIC_AGENTS_TTL:
+        return cached[1]
+    async with _with_session(session) as db:
+        agents = await _agent_crud.get_public_agents(db)
+    _public_agents_cache = (now, agents)
+    return agents
 
 
-async def get_user_agents(owner_id: int) -> list[Agent]:
-    async with _get_session() as db:
+async def get_user_agents(
+    owner_id: int, session: AsyncSession | None = None
+) -> list[Agent]:
+    async with _with_session(session) as db:
         return await _agent_crud.get_by_owner(db, owner_id)
 
 
@@ -349,49 +558,66 @@ async def create_agent(
     workspace_path: str = "",
     price_per_call: float = 0.0,
     is_public: bool = False,
+    session: AsyncSession | None = None,
 ) -> Agent:
-    async with _get_session() as db:
-        return await _agent_crud.create(
+    async with _with_session(session) as db:
+        agent = await _agent_crud.create(
             db, owner_id, name, description,
             openclaw_agent_id, workspace_path, price_per_call, is_public,
         )
+    _invalidate_public_agents_cache()
+    return agent
 
 
-async def update_agent(agent_id: str, **kwargs: Any) -> Agent | None:
-    async with _get_session() as db:
-        return await _agent_crud.update(db, agent_id, **kwargs)
+async def update_agent(
+    agent_id: str, session: AsyncSession | None = None, **kwargs: Any
+) -> Agent | None:
+    async with _with_session(session) as db:
+        agent = await _agent_crud.update(db, agent_id, **kwargs)
+    _invalidate_public_agents_cache()
+    return agent
 
 
-async def delete_agent(agent_id: str) -> bool:
-    async with _get_session() as db:
-        return await _agent_crud.delete(db, agent_id)
+async def delete_agent(agent_id: str, session: AsyncSession | None = None) -> bool:
+    async with _with_session(session) as db:
+        deleted = await _agent_crud.delete(db, agent_id)
+    _invalidate_public_agents_cache()
+    return deleted
 
 
 # ── Wallet helpers ────────────────────────────────────────────────────
 
-async def get_user_wallet(user_id: int) -> Wallet | None:
-    async with _get_session() as db:
+async def get_user_wallet(
+    user_id: int, session: AsyncSession | None = None
+) -> Wallet | None:
+    async with _with_session(session) as db:
         return await _wallet_crud.get_by_user_id(db, user_id)
 
 
-async def get_wallet_by_telegram_id(telegram_id: int) -> Wallet | None:
-    async with _get_session() as db:
-        user = await _user_crud.get_by_telegram_id(db, telegram_id)
-        if not user:
-            return None
-        return await _wallet_crud.get_by_user_id(db, user.id)
+async def get_wallet_by_telegram_id(
+    telegram_id: int, session: AsyncSession | None = None
+) -> Wallet | None:
+    async with _with_session(session) as db:
+        # Denormalized single-table lookup; fall back to one JOIN for
+        # wallets created before telegram_id was stored.
+        wallet = await _wallet_crud.get_by_telegram_id(db, telegram_id)
+        if wallet:
+            return wallet
+        result = await db.execute(_SEL_WALLET_JOIN_USER, {"tg": telegram_id})
+        return result.scalar_one_or_none()
 
 
 async def get_or_create_wallet(
     user_id: int,
     address: str,
     encrypted_key: str,
+    telegram_id: int | None = None,
+    session: AsyncSession | None = None,
 ) -> Wallet:
-    async with _get_session() as db:
-        existing = await _wallet_crud.get_by_user_id(db, user_id)
-        if existing:
-            return existing
-        return await _wallet_crud.create(db, user_id, address, encrypted_key)
+    async with _with_session(session) as db:
+        return await _wallet_crud.get_or_create(
+            db, user_id, address, encrypted_key, telegram_id=telegram_id
+        )
 
 
 # ── Payment helpers ───────────────────────────────────────────────────
@@ -401,20 +627,29 @@ async def record_payment(
     agent_id: str,
     amount: float,
     currency: str = "HKDC",
+    tx_hash: str | None = None,
+    status: str = "pending",
+    session: AsyncSession | None = None,
 ) -> Payment:
-    async with _get_session() as db:
-        return await _task_crud.create_payment(db, payer_user_id, agent_id, amount, currency)
+    async with _with_session(session) as db:
+        return await _task_crud.create_payment(
+            db, payer_user_id, agent_id, amount, currency, tx_hash, status
+        )
 
 
-async def complete_payment(payment_id: int, tx_hash: str) -> Payment | None:
-    async with _get_session() as db:
+async def complete_payment(
+    payment_id: int, tx_hash: str, session: AsyncSession | None = None
+) -> Payment | None:
+    async with _with_session(session) as db:
         return await _task_crud.update_payment(db, payment_id, tx_hash=tx_hash, status="completed")
 
 
 # ── Skill helpers ─────────────────────────────────────────────────────
 
-async def get_agent_skills(agent_id: str) -> list[AgentSkill]:
-    async with _get_session() as db:
+async def get_agent_skills(
+    agent_id: str, session: AsyncSession | None = None
+) -> list[AgentSkill]:
+    async with _with_session(session) as db:
         return await _skill_crud.get_agent_skills(db, agent_id)
 
 
@@ -422,11 +657,14 @@ async def install_skill(
     agent_id: str,
     skill_slug: str,
     source: str = "builtin",
+    session: AsyncSession | None = None,
 ) -> AgentSkill:
-    async with _get_session() as db:
+    async with _with_session(session) as db:
         return await _skill_crud.add_skill(db, agent_id, skill_slug, source)
 
 
-async def remove_skill(agent_id: str, skill_slug: str) -> bool:
-    async with _get_session() as db:
+async def remove_skill(
+    agent_id: str, skill_slug: str, session: AsyncSession | None = None
+) -> bool:
+    async with _with_session(session) as db:
         return await _skill_crud.remove_skill(db, agent_id, skill_slug)
@@ -1,5 +1,8 @@
 """Async database engine and session factory."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from hashbot.config import get_settings
@@ -13,22 +16,96 @@ async def init_db() -> None:
     global _engine, _session_factory
 
     settings = get_settings()
-    _engine = create_async_engine(settings.database_url, echo=False)
+    # Checked-out-from-pool connections instead of fresh opens per session;
+    # recycle guards against server-side idle timeouts. cached_statements
+    # sizes sqlite3's per-connection prepared-statement cache so warm
+    # queries skip re-parsing.
+    _engine = create_async_engine(
+        settings.database_url,
+        echo=False,
+        query_cache_size=settings.db_statement_cache_size,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args={"cached_statements": settings.db_statement_cache_size},
+    )
     _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
 
     from hashbot.db.models import Base
 
     async with _engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await _migrate_schema(conn)
+
+
+async def _migrate_schema(conn) -> None:
+    """Apply additive schema changes to pre-existing databases.
+
+    create_all skips tables that already exist, so columns and indexes
+    added to the models after a database was first created have to be
+    backfilled here.
+    """
+    result = await conn.exec_driver_sql("PRAGMA table_info(wallets)")
+    wallet_columns = {row[1] for row in result}
+    if "telegram_id" not in wallet_columns:
+        await conn.exec_driver_sql("ALTER TABLE wallets ADD COLUMN telegram_id INTEGER")
+        await conn.exec_driver_sql(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_wallets_telegram_id"
+            " ON wallets (telegram_id)"
+        )
+    # Indexes declared in __table_args__ after first deployment; keep the
+    # DDL in lockstep with the model definitions in models.py.
+    await conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_agents_public ON agents (id) WHERE is_public = 1"
+    )
+    await conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_payments_user_created"
+        " ON payments (payer_user_id, created_at, id)"
+    )
 
 
 def get_db() -> AsyncSession:
-    """Return a new async session."""
+    """Return a new async session.
+
+    Callers that need several CRUD calls in one transaction pass this
+    session explicitly (see ``crud._with_session``) rather than relying
+    on a task-scoped singleton: the bot spawns background tasks inside a
+    request, so ``asyncio.current_task`` is not a reliable unit of work
+    here and an ``async_scoped_session`` would leak sessions across
+    unrelated coroutines.
+    """
     if _session_factory is None:
         raise RuntimeError("Database not initialised — call init_db() first")
     return _session_factory()
 
 
+def pool_status() -> str | None:
+    """Human-readable connection-pool status, or None before init_db."""
+    if _engine is None:
+        return None
+    return _engine.pool.status()
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """One session and one final commit for a multi-step workflow.
+
+    Pass the yielded session to the crud helpers (their ``session=``
+    parameter) so a handler touching several tables pays a single pool
+    checkout and a single fsync instead of one per call. Rolls back on
+    error.
+    """
+    session = get_db()
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 async def close_db() -> None:
     """Dispose engine on shutdown."""
     global _engine, _session_factory
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String, Text, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -32,6 +32,15 @@ class User(Base):
 
 class Agent(Base):
     __tablename__ = "agents"
+    __table_args__ = (
+        # Partial index: the public-marketplace listing only ever touches
+        # public agents, so keep the index proportional to their count.
+        Index(
+            "ix_agents_public",
+            "id",
+            sqlite_where=text("is_public = 1"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(16), primary_key=True, default=_uuid)
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -54,6 +63,9 @@ class Wallet(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), unique=True)
+    # Denormalized from User so the per-interaction wallet lookup is a
+    # single-table hit on the natural key instead of a join.
+    telegram_id: Mapped[int | None] = mapped_column(unique=True, index=True)
     address: Mapped[str] = mapped_column(String(42))
     encrypted_private_key: Mapped[str] = mapped_column(Text, default="")
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -76,6 +88,12 @@ class AgentSkill(Base):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        # Covers the per-user history query; SQLite walks it backwards
+        # for the created_at DESC ordering. id breaks ties between rows
+        # stamped in the same second so the keyset cursor stays exact.
+        Index("ix_payments_user_created", "payer_user_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     payer_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -1,9 +1,14 @@
 """HashKey Chain interaction layer."""
 
-from typing import Any
+from __future__ import annotations
 
-from web3 import AsyncWeb3, Web3
-from web3.middleware import ExtraDataToPOAMiddleware
+import time
+from typing import TYPE_CHECKING, Any
+
+# web3 pulls in the whole eth-abi/eth-account tree (~hundreds of ms of
+# import work); defer it until a chain object is actually used.
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3, Web3
 
 
 class HashKeyChain:
@@ -44,11 +49,19 @@ class HashKeyChain:
 
         self._web3: Web3 | None = None
         self._async_web3: AsyncWeb3 | None = None
+        # Chain-wide values that only move once per block; a short TTL
+        # absorbs bursts of concurrent reads without a RPC call each.
+        self._rpc_cache_ttl = 2.0
+        self._block_number_cache: tuple[float, int] | None = None
+        self._gas_price_cache: tuple[float, int] | None = None
 
     @property
     def web3(self) -> Web3:
         """Get synchronous Web3 instance."""
         if self._web3 is None:
+            from web3 import Web3
+            from web3.middleware import ExtraDataToPOAMiddleware
+
             self._web3 = Web3(Web3.HTTPProvider(self.rpc_url))
             # Add POA middleware for HashKey Chain
             self._web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
@@ -58,9 +71,17 @@ class HashKeyChain:
     def async_web3(self) -> AsyncWeb3:
         """Get async Web3 instance."""
         if self._async_web3 is None:
+            from web3 import AsyncWeb3
+
             self._async_web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
         return self._async_web3
 
+    @staticmethod
+    def _checksum(address: str) -> Any:
+        from web3 import Web3
+
+        return Web3.to_checksum_address(address)
+
     def is_connected(self) -> bool:
         """Check if connected to the network."""
         try:
@@ -77,19 +98,25 @@ class HashKeyChain:
 
     def get_balance(self, address: str) -> int:
         """Get native token balance in wei."""
-        return self.web3.eth.get_balance(Web3.to_checksum_address(address))
+        return self.web3.eth.get_balance(self._checksum(address))
 
     async def get_balance_async(self, address: str) -> int:
         """Get native token balance in wei (async)."""
-        return await self.async_web3.eth.get_balance(Web3.to_checksum_address(address))
+        return await self.async_web3.eth.get_balance(self._checksum(address))
 
     def get_block_number(self) -> int:
         """Get current block number."""
         return self.web3.eth.block_number
 
     async def get_block_number_async(self) -> int:
-        """Get current block number (async)."""
-        return await self.async_web3.eth.block_number
+        """Get current block number (async, cached for a couple of seconds)."""
+        cached = self._block_number_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < self._rpc_cache_ttl:
+            return cached[1]
+        block_number = await self.async_web3.eth.block_number
+        self._block_number_cache = (now, block_number)
+        return block_number
 
     def get_transaction(self, tx_hash: str) -> dict[str, Any]:
         """Get transaction by hash."""
@@ -129,8 +156,14 @@ class HashKeyChain:
         return self.web3.eth.gas_price
 
     async def get_gas_price_async(self) -> int:
-        """Get current gas price (async)."""
-        return await self.async_web3.eth.gas_price
+        """Get current gas price (async, cached for a couple of seconds)."""
+        cached = self._gas_price_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < self._rpc_cache_ttl:
+            return cached[1]
+        gas_price = await self.async_web3.eth.gas_price
+        self._gas_price_cache = (now, gas_price)
+        return gas_price
 
     def estimate_gas(self, transaction: dict[str, Any]) -> int:
         """Estimate gas for a transaction."""
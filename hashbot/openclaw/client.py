@@ -19,10 +19,17 @@ class OpenClawClient:
             headers = {}
             if self.token:
                 headers["Authorization"] = f"Bearer {self.token}"
+            # One pooled client per OpenClawClient: keep-alive connections
+            # amortize the TCP/TLS handshake across requests.
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=headers,
                 timeout=120,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=100,
+                    keepalive_expiry=60.0,
+                ),
             )
         return self._client
 
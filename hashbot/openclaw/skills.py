@@ -1,5 +1,7 @@
 """Built-in HashBot skills (SKILL.md content for OpenClaw agents)."""
 
+import functools
+
 BUILTIN_SKILLS: dict[str, dict[str, str]] = {
     "hsk-crypto-price": {
         "name": "Crypto Price Checker",
@@ -58,8 +60,13 @@ def get_skill(slug: str) -> dict[str, str] | None:
     return BUILTIN_SKILLS.get(slug)
 
 
+@functools.cache
 def list_skills() -> list[dict[str, str]]:
-    """List all built-in skills."""
+    """List all built-in skills.
+
+    BUILTIN_SKILLS is a module constant, so the summary list is built once;
+    call ``list_skills.cache_clear()`` if the catalog is ever mutated.
+    """
     return [
         {"slug": slug, "name": s["name"], "description": s["description"]}
         for slug, s in BUILTIN_SKILLS.items()
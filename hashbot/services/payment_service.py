@@ -9,6 +9,7 @@ from web3 import Web3
 
 from hashbot.config import get_settings
 from hashbot.db import crud
+from hashbot.db.engine import session_scope
 from hashbot.hashkey.chain import HashKeyChain
 from hashbot.hashkey.tokens import ERC20Token
 from hashbot.x402.payment import (
@@ -152,19 +153,22 @@ class PaymentService:
         tx_hash: str | None = None,
     ) -> dict[str, Any]:
         """Record a payment in the database."""
-        user = await crud.get_user_by_telegram_id(telegram_id)
-        if not user:
-            return {"success": False, "error": "User not found"}
-
-        payment = await crud.record_payment(
-            payer_user_id=user.id,
-            agent_id=agent_id,
-            amount=float(amount),
-            currency="HKDC",
-        )
-
-        if tx_hash:
-            await crud.complete_payment(payment.id, tx_hash)
+        async with session_scope() as db:
+            user = await crud.get_user_by_telegram_id(telegram_id, session=db)
+            if not user:
+                return {"success": False, "error": "User not found"}
+
+            # Known tx_hash means the payment is already settled: insert it
+            # completed in one statement rather than INSERT + UPDATE.
+            payment = await crud.record_payment(
+                payer_user_id=user.id,
+                agent_id=agent_id,
+                amount=float(amount),
+                currency="HKDC",
+                tx_hash=tx_hash,
+                status="completed" if tx_hash else "pending",
+                session=db,
+            )
 
         return {
             "success": True,
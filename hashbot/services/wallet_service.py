@@ -88,6 +88,7 @@ class WalletService:
             user_id=user.id,
             address=address,
             encrypted_key=encrypted_key,
+            telegram_id=telegram_id,
         )
 
         return {
@@ -135,6 +136,7 @@ class WalletService:
             user_id=user.id,
             address=account.address,
             encrypted_key=encrypted_key,
+            telegram_id=telegram_id,
         )
 
         return {
@@ -8,6 +8,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from hashbot.a2a.protocol import close_shared_client
+
 # Import example agents to register them
 from hashbot.agents.examples import (  # noqa: F401
     CodeReviewerAgent,
@@ -40,8 +42,9 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialised")
 
-    # Initialize agent registry
+    # Initialize agent registry and warm instances off the request path
     registry = get_registry()
+    await registry.warmup()
     print(f"Registered agents: {[a['id'] for a in registry.list_agents()]}")
 
     # Initialize OpenClaw client + manager
@@ -59,6 +62,7 @@ async def lifespan(app: FastAPI):
     print("Shutting down HashBot...")
     await openclaw_client.close()
     await registry.shutdown()
+    await close_shared_client()
     await close_db()
 
 
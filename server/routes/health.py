@@ -8,6 +8,7 @@ from fastapi.responses import RedirectResponse
 
 from hashbot.agents.registry import get_registry
 from hashbot.config import get_settings
+from hashbot.db.engine import pool_status
 from hashbot.openclaw.client import OpenClawClient
 
 router = APIRouter()
@@ -58,6 +59,7 @@ async def health():
         "agents": len(registry.list_agents()),
         "openclaw_status": openclaw_status,
         "openclaw_url": settings.openclaw_gateway_url,
+        "db_pool": pool_status(),
     }
 
 
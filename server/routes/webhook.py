@@ -2,6 +2,7 @@
 
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
 
 from hashbot.config import get_settings
@@ -18,7 +19,7 @@ async def telegram_webhook(request: Request):
         raise HTTPException(status_code=503, detail="Telegram not configured")
 
     try:
-        await request.json()  # validate JSON body
+        orjson.loads(await request.body())  # validate JSON body
 
         # In production, this would be handled by python-telegram-bot
         # For now, just acknowledge receipt
@@ -33,7 +34,7 @@ async def telegram_webhook(request: Request):
 async def x402_payment_webhook(request: Request):
     """Handle x402 payment notifications."""
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
 
         # Extract payment info
         task_id = data.get("taskId")
@@ -1,6 +1,10 @@
 """Tests for A2A Protocol implementation."""
 
-from hashbot.a2a.messages import AgentCard, Task, TaskState
+import pytest
+
+from hashbot.a2a.executor import A2AExecutor
+from hashbot.a2a.messages import A2AMessage, A2AResponse, AgentCard, Task, TaskState
+from hashbot.a2a.protocol import A2AProtocol, BatchingA2AProtocol
 
 
 class TestTask:
@@ -59,3 +63,129 @@ class TestAgentCard:
         )
 
         assert card.x402_enabled is True
+
+
+def _make_executor() -> A2AExecutor:
+    card = AgentCard(
+        name="TestAgent",
+        description="A test agent",
+        url="http://localhost:8000",
+    )
+    executor = A2AExecutor(card)
+
+    @executor.handler("default")
+    async def echo(task: Task) -> dict:
+        task.status = TaskState.COMPLETED
+        return {"id": task.id, "status": {"state": TaskState.COMPLETED.value}}
+
+    return executor
+
+
+class TestA2AExecutorBatch:
+    """Test JSON-RPC batch dispatch in A2AExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_batch_dispatch_preserves_order(self):
+        """A batch of requests gets one response per request, in order."""
+        executor = _make_executor()
+        batch = [
+            {"jsonrpc": "2.0", "id": "req-1", "method": "tasks/send", "params": {}},
+            {"jsonrpc": "2.0", "id": "req-2", "method": "tasks/send", "params": {}},
+        ]
+
+        responses = await executor.handle_request(batch)
+
+        assert [r["id"] for r in responses] == ["req-1", "req-2"]
+        assert all("result" in r for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_batch_dispatch_from_bytes(self):
+        """Raw transport bytes holding a batch take the same path."""
+        executor = _make_executor()
+        body = (
+            b'[{"jsonrpc":"2.0","id":"req-1","method":"tasks/send","params":{}},'
+            b'{"jsonrpc":"2.0","id":"req-2","method":"tasks/send","params":{}}]'
+        )
+
+        responses = await executor.handle_request(body)
+
+        assert [r["id"] for r in responses] == ["req-1", "req-2"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_an_error(self):
+        """JSON-RPC 2.0: an empty batch is answered with a single error."""
+        executor = _make_executor()
+
+        for request in ([], b"[]"):
+            response = await executor.handle_request(request)
+            assert isinstance(response, dict)
+            assert response["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_batch_with_unknown_method(self):
+        """A bad entry gets its own error without failing the batch."""
+        executor = _make_executor()
+        batch = [
+            {"jsonrpc": "2.0", "id": "req-1", "method": "tasks/send", "params": {}},
+            {"jsonrpc": "2.0", "id": "req-2", "method": "tasks/nope", "params": {}},
+        ]
+
+        responses = await executor.handle_request(batch)
+
+        assert "result" in responses[0]
+        assert responses[1]["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_json(self):
+        """Malformed batch bytes are rejected as one invalid request."""
+        executor = _make_executor()
+
+        response = await executor.handle_request(b'[{"jsonrpc":')
+
+        assert response["error"]["code"] == -32600
+
+
+class TestBatchingA2AProtocol:
+    """Test the outbound batch buffer."""
+
+    @pytest.mark.asyncio
+    async def test_flush_resolves_futures_in_one_batch(self):
+        """Messages to one target flush as a single send_batch call."""
+        card = AgentCard(name="A", description="a", url="http://localhost:8000")
+        protocol = A2AProtocol(card)
+        calls: list[list[A2AMessage]] = []
+
+        async def fake_send_batch(target_url, messages):
+            calls.append(messages)
+            return [
+                A2AResponse(id=m.id, result={"echo": m.method}) for m in messages
+            ]
+
+        protocol.send_batch = fake_send_batch
+
+        msg1 = A2AMessage(method="tasks/send")
+        msg2 = A2AMessage(method="tasks/get")
+        async with BatchingA2AProtocol(protocol) as batcher:
+            fut1 = await batcher.enqueue("http://peer", msg1)
+            fut2 = await batcher.enqueue("http://peer", msg2)
+
+        assert len(calls) == 1
+        assert fut1.result().id == msg1.id
+        assert fut2.result().result == {"echo": "tasks/get"}
+
+    @pytest.mark.asyncio
+    async def test_send_failure_propagates_to_futures(self):
+        """A failed flush rejects every buffered future."""
+        card = AgentCard(name="A", description="a", url="http://localhost:8000")
+        protocol = A2AProtocol(card)
+
+        async def fake_send_batch(target_url, messages):
+            raise ConnectionError("peer down")
+
+        protocol.send_batch = fake_send_batch
+
+        async with BatchingA2AProtocol(protocol) as batcher:
+            future = await batcher.enqueue("http://peer", A2AMessage(method="tasks/send"))
+
+        with pytest.raises(ConnectionError):
+            future.result()
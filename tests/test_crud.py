@@ -1,5 +1,7 @@
 """Comprehensive tests for database CRUD operations and convenience functions."""
 
+from datetime import datetime
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -150,6 +152,30 @@ class TestUserCRUD:
         assert user1.id == user2.id
         assert user2.telegram_username == "heidi"  # original, not updated
 
+    @pytest.mark.asyncio
+    async def test_upsert_wallet_inserts(self, session: AsyncSession):
+        crud = UserCRUD()
+        await crud.upsert_wallet(
+            session, telegram_id=1010, username="ivan",
+            wallet_address="0x" + "1" * 40, encrypted_private_key="enc1",
+        )
+        user = await crud.get_by_telegram_id(session, 1010)
+        assert user is not None
+        assert user.wallet_address == "0x" + "1" * 40
+
+    @pytest.mark.asyncio
+    async def test_upsert_wallet_updates_existing(self, session: AsyncSession):
+        crud = UserCRUD()
+        await crud.create(session, telegram_id=1111, username="judy")
+        await crud.upsert_wallet(
+            session, telegram_id=1111, username="judy",
+            wallet_address="0x" + "2" * 40, encrypted_private_key="enc2",
+        )
+        user = await crud.get_by_telegram_id(session, 1111)
+        assert user is not None
+        assert user.wallet_address == "0x" + "2" * 40
+        assert user.encrypted_private_key == "enc2"
+
 
 # ── AgentCRUD class tests ───────────────────────────────────────────
 
@@ -306,6 +332,56 @@ class TestTaskCRUD:
         payments = await crud.get_user_payments(session, user.id)
         assert len(payments) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_user_payments_keyset_pagination(self, session: AsyncSession):
+        user, agent = await self._setup(session)
+        crud = TaskCRUD()
+        for day in (1, 2, 3):
+            session.add(
+                Payment(
+                    payer_user_id=user.id,
+                    agent_id=agent.id,
+                    amount=float(day),
+                    created_at=datetime(2026, 1, day),
+                )
+            )
+        await session.commit()
+
+        first_page = await crud.get_user_payments(session, user.id, limit=2)
+        assert [float(p.amount) for p in first_page] == [3.0, 2.0]
+
+        cursor = (first_page[-1].created_at, first_page[-1].id)
+        second_page = await crud.get_user_payments(session, user.id, limit=2, before=cursor)
+        assert [float(p.amount) for p in second_page] == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_get_user_payments_pagination_same_second(self, session: AsyncSession):
+        """Rows stamped in the same second must not be skipped at a page break."""
+        user, agent = await self._setup(session)
+        crud = TaskCRUD()
+        stamp = datetime(2026, 1, 1, 12, 0, 0)
+        for amount in (1.0, 2.0, 3.0):
+            session.add(
+                Payment(
+                    payer_user_id=user.id,
+                    agent_id=agent.id,
+                    amount=amount,
+                    created_at=stamp,
+                )
+            )
+        await session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            page = await crud.get_user_payments(session, user.id, limit=2, before=cursor)
+            if not page:
+                break
+            seen.extend(float(p.amount) for p in page)
+            cursor = (page[-1].created_at, page[-1].id)
+
+        assert sorted(seen) == [1.0, 2.0, 3.0]
+
 
 # ── AgentSkillCRUD class tests ──────────────────────────────────────
 